@@ -13,6 +13,18 @@ setup(
         "python-dotenv>=0.17.1",
         "PyQt5>=5.15.4",
         "chardet>=4.0.0",
+        "lxml>=4.6.3",
+        "aiodns>=2.0.0",
+        "pybloom-live>=3.0.0",
+        "orjson>=3.5.2",
+        "pyahocorasick>=1.4.2",
+        "aiofiles>=0.8.0",
+        "qasync>=0.13.0",
+        "diskcache>=5.2.1",
+        "async-lru>=2.0",
+        "rapidfuzz>=2.5.0",
+        "google-re2>=1.0",
+        "numpy>=1.23.2",
     ],
     entry_points={
         "console_scripts": [
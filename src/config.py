@@ -13,4 +13,18 @@ class Config:
     DOMAIN_RATE_LIMIT = float(os.getenv('DOMAIN_RATE_LIMIT', '5'))  # requests per second per domain
     DOMAIN_TIME_PERIOD = float(os.getenv('DOMAIN_TIME_PERIOD', '1'))  # in seconds
 
+    # Downloads ScraperEngine keeps in flight, overall and per host (the rates above still meter how fast they start)
+    SCRAPE_CONCURRENCY = int(os.getenv('SCRAPE_CONCURRENCY', '10'))
+    SCRAPE_CONCURRENCY_PER_HOST = int(os.getenv('SCRAPE_CONCURRENCY_PER_HOST', '8'))
+
+    # Hosts whose pages are always rendered, because their content is built with JavaScript (comma separated)
+    JS_REQUIRED_HOSTS = frozenset(host.strip().lower() for host in os.getenv('JS_REQUIRED_HOSTS', '').split(',') if host.strip())
+
+    # Number of pages QtWebEngine renders at the same time
+    RENDER_CONCURRENCY = int(os.getenv('RENDER_CONCURRENCY', '8'))
+
+    # Downloaded page cache
+    HTTP_CACHE_DIR = os.getenv('HTTP_CACHE_DIR', os.path.join('.cache', 'http'))
+    HTTP_CACHE_TTL = float(os.getenv('HTTP_CACHE_TTL', '86400'))  # in seconds
+
 config = Config()
\ No newline at end of file
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import queue
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext
 
@@ -56,6 +57,13 @@ class ScraperGUI:
 
     async def ignition(self, fuel):
         
+        # ask for the output file up front so valid results can be written as they are validated
+        filename = filedialog.asksaveasfilename(defaultextension=".csv")
+        if not filename:
+            self.logger.warning("No file selected. Scrape cancelled.")
+            messagebox.showwarning("Warning", "No file selected. Scrape cancelled.")
+            return
+        
         # Create a DataValidator object
         qualityControl = DataValidator()
         self.logger.info(f"{len(fuel)} URL(s) Recieved. Async Engine Running...")
@@ -64,41 +72,37 @@ class ScraperGUI:
         results = await start_engine(fuel)
         self.logger.info(f"Received reuslts for {len(results)} URLs.")
         
-        all_results = []
-        
-        for url, url_results in results.items():
-            self.logger.info(f"Processing results for URL: {url}")
-            self.logger.info(f"Number of results for this URL: {len(url_results)}")
-            
-            if url_results:
-                self.logger.info(f"url_results (in main.py) contains data.")
+        def valid_results():
+            for url, url_results in results.items():
+                self.logger.info(f"Processing results for URL: {url}")
+                self.logger.info(f"Number of results for this URL: {len(url_results)}")
                 
-                for result in url_results:
-                    self.logger.info(f"Validating result: {result}")
+                if url_results:
+                    self.logger.info(f"url_results (in main.py) contains data.")
                     
-                    if isinstance(result, dict) and qualityControl.validate_contact_info(result):
-                        is_valid = qualityControl.validate_contact_info(result)
-                        self.logger.info(f"Validataion Result: {is_valid}")
+                    for result in url_results:
+                        self.logger.info(f"Validating result: {result}")
                         
-                        if is_valid:
-                            result['source_url'] = url
-                            all_results.append(result)
-                    else:
-                        self.logger.warning(f"Unexpected result type: {type(result)}")
-                self.logger.info(f"Found {len(url_results)} results from {url}")
-            else:
-                self.logger.warning(f"No results found for {url}")
-        self.logger.info(f"Total Valid Results: {len(all_results)}")
+                        if isinstance(result, dict):
+                            is_valid = qualityControl.validate_contact_info(result)
+                            self.logger.info(f"Validataion Result: {is_valid}")
+                            
+                            if is_valid:
+                                result['source_url'] = url
+                                yield result
+                        else:
+                            self.logger.warning(f"Unexpected result type: {type(result)}")
+                    self.logger.info(f"Found {len(url_results)} results from {url}")
+                else:
+                    self.logger.warning(f"No results found for {url}")
         
-        if all_results:
-            filename = filedialog.asksaveasfilename(defaultextension=".csv")
-            if filename:
-                CSVUtils.write_to_csv(all_results, filename)
-                self.logger.info(f"Results saved to {filename}")
-                messagebox.showinfo("Success", f"Results saved to {filename}")
-            else:
-                self.logger.warning("No file selected. Results not saved.")
-                messagebox.showwarning("Warning", "No file selected. Results not saved.")
+        # rows go straight to the file; nothing accumulates in memory
+        written = CSVUtils.write_to_csv(valid_results(), filename)
+        self.logger.info(f"Total Valid Results: {written}")
+        
+        if written:
+            self.logger.info(f"Results saved to {filename}")
+            messagebox.showinfo("Success", f"Results saved to {filename}")
         else:
             self.logger.info("No valid results found.")
             messagebox.showinfo("Info", "No valid results found.")
@@ -107,15 +111,26 @@ class TextHandler(logging.Handler):
     def __init__(self, text_widget):
         super().__init__()
         self.text_widget = text_widget
+        # records are queued here and written to the widget in batches, not one Tk callback per record
+        self.pending = queue.SimpleQueue()
+        self.text_widget.after(50, self.flush_pending)
 
     def emit(self, record):
-        msg = self.format(record)
-        def append():
+        self.pending.put(self.format(record))
+
+    def flush_pending(self):
+        lines = []
+        while True:
+            try:
+                lines.append(self.pending.get_nowait())
+            except queue.Empty:
+                break
+        if lines:
             self.text_widget.configure(state='normal')
-            self.text_widget.insert(tk.END, msg + '\n')
+            self.text_widget.insert(tk.END, '\n'.join(lines) + '\n')
             self.text_widget.configure(state='disabled')
             self.text_widget.yview(tk.END)
-        self.text_widget.after(0, append)
+        self.text_widget.after(50, self.flush_pending)
 
 def main():
     logger.info("Loading environment variables...")
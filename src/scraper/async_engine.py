@@ -1,11 +1,23 @@
 import asyncio
 import argparse
-import json
-import socket
-from urllib.parse import urljoin, urlparse
+import codecs
+import logging
+import multiprocessing
+import os
+import re
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from urllib.parse import urldefrag, urljoin, urlsplit, urlunsplit
 
+import aiofiles
 import aiohttp
-from bs4 import BeautifulSoup
+import lxml.html
+import orjson
+from lxml import etree
+from pybloom_live import ScalableBloomFilter
 
 from src.scraper.extractors import ContactInfoExtractor
 from src.utils.logging_utils import setup_logging, get_logger
@@ -13,13 +25,136 @@ from src.utils.logging_utils import setup_logging, get_logger
 setup_logging()
 logger = get_logger(__name__)
 
+@lru_cache(maxsize=4096)
+def _split(url):
+    # the same URL is often linked several times on one page, and is then both checked and scored
+    return urlsplit(url)
+
+def canonicalize_url(url):
+    """ Drop the fragment, lowercase the host and strip any trailing slash so repeated links compare equal """
+    url, _ = urldefrag(url)
+    parts = urlsplit(url)
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme, parts.netloc.lower(), path, parts.query, ''))
+
+@lru_cache(maxsize=4096)
+def _resolve(base, href):
+    return canonicalize_url(urljoin(base, href))
+
+def resolve_link(base_url, origin, href):
+    """ Absolute, canonical form of `href` found on `base_url` (whose scheme://host is `origin`) """
+    # absolute and root-relative links don't depend on the page's path; resolving them against the origin
+    # lets nav/footer links repeated on every page of a site hit the cache
+    if href[0] == '/' or href.startswith(('http://', 'https://')):
+        return _resolve(origin, href)
+    return _resolve(base_url, href)
+
+def link_pairs(anchors):
+    """ (href, text) of each `a[@href]` element, as plain strings that can cross a process boundary """
+    return [(anchor.get('href'), str(anchor.text_content())) for anchor in anchors]
+
+_process_extractor = None
+
+def init_worker(log_queue):
+    """ Pool initializer: send this process's log records to the parent's handlers through `log_queue`
+    Importing the scraper modules ran `setup_logging()` here too; those file handlers are closed, so only the
+    parent ever writes (and rotates) the log files.
+    """
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    root.addHandler(QueueHandler(log_queue))
+
+def extract_in_process(url, html):
+    """ Pool worker: parse the raw page bytes once, extract contact info and collect the page's links
+    Returns:
+        (dict, [(str, str)]): The page's extraction status and its (href, text) links for the crawl
+    """
+    global _process_extractor
+    if _process_extractor is None:
+        _process_extractor = ContactInfoExtractor()
+    tree = _process_extractor.html_parser.document(html)
+    anchors = tree.xpath('//a[@href]')
+    return _process_extractor.extract_contact_info(url, html, tree=tree, anchors=anchors), link_pairs(anchors)
+
+class LinkFrontier:
+    """Priority queue of (priority, url, depth) for a single crawl.
+
+    Priorities come from a small integer range, so items are kept in one FIFO deque per priority and
+    `get` pops from the lowest one present; an `asyncio.Event` wakes idle workers. Mirrors the
+    `get`/`task_done`/`join` interface of `asyncio.PriorityQueue` without its heap or per-call locking.
+    """
+    def __init__(self):
+        self._buckets = {}
+        self._wake = asyncio.Event()
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    def put(self, item):
+        bucket = self._buckets.get(item[0])
+        if bucket is None:
+            bucket = self._buckets[item[0]] = deque()
+        bucket.append(item)
+        self._unfinished += 1
+        self._finished.clear()
+        self._wake.set()
+
+    async def get(self):
+        while not self._buckets:
+            self._wake.clear()
+            await self._wake.wait()
+        priority = min(self._buckets)
+        bucket = self._buckets[priority]
+        item = bucket.popleft()
+        if not bucket:
+            del self._buckets[priority]
+        return item
+
+    def task_done(self):
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._finished.set()
+
+    async def join(self):
+        await self._finished.wait()
+
+def html_feed_parser(charset):
+    """ An lxml feed parser for a body the server says is in `charset`
+    An unknown or misspelled charset falls back to lxml's own detection (meta tags, BOM), as a missing one does.
+    """
+    if charset:
+        try:
+            codecs.lookup(charset)
+            return lxml.html.HTMLParser(encoding=charset)
+        except LookupError:
+            # Python knows the name but libxml2 may not, so lxml's own LookupError lands here too
+            pass
+    return lxml.html.HTMLParser()
+
 class AsyncScraper:
-    def __init__(self, max_depth=3, max_pages_per_domain=50):
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    }
+
+    def __init__(self, max_depth=3, max_pages_per_domain=50, concurrency=10, max_per_host=8, extractor=None, cpu_pool=None, sink=None):
         self.logger = get_logger(self.__class__.__name__)
-        self.extractor = ContactInfoExtractor()
+        self.extractor = extractor or ContactInfoExtractor()
+        # when set, extraction runs in these worker processes and the event loop only does I/O and link discovery
+        self.cpu_pool = cpu_pool
+        # when set, each page's results are awaited into `sink(url, page_results)` instead of kept in memory
+        self.sink = sink
         self.max_depth = max_depth
         self.max_pages_per_domain = max_pages_per_domain
+        self.concurrency = concurrency
+        self.semaphore = asyncio.Semaphore(concurrency)
+        # keeps each host polite however many workers are running
+        self.max_per_host = max_per_host
+        self._host_sems = {}
         self.seen_urls = set()
+        # compact record of every URL already put on the frontier (a false positive only skips one page)
+        self._bloom = ScalableBloomFilter(initial_capacity=10000, error_rate=1e-6)
         self.relevant_keywords = [
             'our-story', 'join-us', 'company-info', 'about-company', 'employees',
             'get-in-touch', 'people', 'divisions', 'team', 'board', 'contact-us',
@@ -30,120 +165,188 @@ class AsyncScraper:
             'events', 'blog', 'support', 'founder', 'who-we-are', 'management',
             'about-us', 'mission', 'locations', 'values', 'help', 'our-team', 'contact'
         ]
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-
-    async def scrape(self, start_url):
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            queue = asyncio.PriorityQueue()
-            await queue.put((0, start_url, 0))  # (priority, url, depth)
-            results = {}
-
-            while not queue.empty():
-                _, url, depth = await queue.get()
-                if depth > self.max_depth or len(self.seen_urls) >= self.max_pages_per_domain:
-                    continue
-
-                if not self.is_valid_url(start_url, url):
-                    continue
-
-                self.seen_urls.add(url)
-                html = await self.fetch_html(session, url)
-                if html:
-                    
-                    # make sure html is a string before passing it to extract_contact_info
-                    if isinstance(html, list):
-                        self.logger.info(f"HTML received in `scrape` was type: `list` for URL: {url}")
-                        html = ' '.join(map(str, html))
-                    page_results = self.extractor.extract_contact_info(url, html)
-                    self.logger.info(f"Results from ContactInfoExtractor() for {url}: {page_results}")
-                    
-                    if isinstance(page_results, dict):
-                        page_results = [page_results]
-                        
-                    elif not isinstance(page_results, list):
-                        self.logger.error(f"Unexpected result from extract_contact_info for URL {url}: {type(page_results)}")
-                        page_results = []
-                        
-                    # Store results for each URL 
-                    results[url] = page_results  
-
-                    if depth < self.max_depth:
-                        await self.enqueue_related_urls(queue, html, url, depth)
-
-            return results
-
-    async def fetch_html(self, session, url, max_retries=3):
+        # all keywords in one pattern so each string is scanned once
+        self._kw_re = re.compile('|'.join(map(re.escape, self.relevant_keywords)))
+
+    async def scrape(self, session, start_url):
+        queue = LinkFrontier()
+        start_url = canonicalize_url(start_url)
+        self._base_domain = _split(start_url).netloc
+        self._bloom.add(start_url)
+        queue.put((0, start_url, 0))  # (priority, url, depth)
+        results = {}
+
+        # crawl the frontier with a pool of workers, then shut them down once every queued URL is handled
+        workers = [asyncio.create_task(self.worker(session, queue, results)) for _ in range(self.concurrency)]
+        await queue.join()
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        return results
+
+    async def worker(self, session, queue, results):
+        while True:
+            _, url, depth = await queue.get()
+            try:
+                await self.process_url(session, queue, url, depth, results)
+            except Exception as e:
+                # one bad page must not kill the worker, or join() could wait on items nobody will take
+                self.logger.error("Error processing %s: %s", url, e, exc_info=True)
+            finally:
+                queue.task_done()
+
+    async def process_url(self, session, queue, url, depth, results):
+        if depth > self.max_depth or len(self.seen_urls) >= self.max_pages_per_domain:
+            return
+
+        if not self.is_valid_url(url):
+            return
+
+        # mark the URL as seen before awaiting the fetch so no other worker picks it up
+        self.seen_urls.add(url)
+        # with a pool, the worker parses the page; parsing it here as well would do the work twice
+        html, tree, _ = await self.fetch_page(session, url, parse=self.cpu_pool is None)
+        if html:
+            
+            # make sure html is a string before passing it to extract_contact_info
+            if isinstance(html, list):
+                self.logger.info("HTML received in `scrape` was type: `list` for URL: %s", url)
+                html = ' '.join(map(str, html))
+            if self.cpu_pool is None:
+                # one walk over the page's links serves both the extractor and link discovery
+                anchors = tree.xpath('//a[@href]') if tree is not None else []
+                page_results = self.extractor.extract_contact_info(url, html, tree=tree, anchors=anchors)
+                links = link_pairs(anchors)
+            else:
+                # lxml trees can't be pickled, so the worker parses the bytes and sends back the links
+                loop = asyncio.get_running_loop()
+                page_results, links = await loop.run_in_executor(self.cpu_pool, extract_in_process, url, html)
+            self.logger.info("Results from ContactInfoExtractor() for %s: %s", url, page_results)
+            
+            if isinstance(page_results, dict):
+                page_results = [page_results]
+                
+            elif not isinstance(page_results, list):
+                self.logger.error("Unexpected result from extract_contact_info for URL %s: %s", url, type(page_results))
+                page_results = []
+                
+            # Store results for each URL 
+            if self.sink is None:
+                results[url] = page_results
+            else:
+                await self.sink(url, page_results)
+
+            if depth < self.max_depth:
+                self.enqueue_related_urls(queue, links, url, depth)
+
+    def host_semaphore(self, url):
+        domain = _split(url).netloc
+        if domain not in self._host_sems:
+            self._host_sems[domain] = asyncio.Semaphore(self.max_per_host)
+        return self._host_sems[domain]
+
+    async def fetch_page(self, session, url, limiters=(), parse=True):
+        """ Download `url` in one of the scraper's `concurrency` slots
+        Each of `limiters` (e.g. `AsyncLimiter`s) is waited on before a slot is taken, so a request held back by a
+        rate limit doesn't keep other requests from running.
+        Returns:
+            (bytes, HtmlElement, str): As `fetch_html`
+        """
+        for limiter in limiters:
+            await limiter.acquire()
+        async with self.semaphore:
+            return await self.fetch_html(session, url, parse=parse)
+
+    async def fetch_html(self, session, url, max_retries=3, parse=True):
+        """ Download `url`
+        Returns:
+            (bytes, HtmlElement, str): The body, the lxml tree built while it streamed in if `parse`, and the
+            body's media type (taken as text/html if none is given); (None, None, None) on failure
+        """
         retries = 0
         while retries < max_retries:
             try:
-                # First, try to resolve the domain
-                domain = urlparse(url).netloc
-                try:
-                    socket.gethostbyname(domain)
-                except socket.gaierror:
-                    self.logger.error(f"DNS resolution failed for {domain}")
-                    return None
-
-                async with session.get(url, timeout=30) as response:
+                async with self.host_semaphore(url), session.get(url, timeout=30) as response:
                     if response.status == 200:
-                        html = await response.text()
-                        if isinstance(html, list):
-                            self.logger.info(f"HTML received by `fetch_html` is type: `list` for URL: {url}")
-                            html = ' '.join(map(str, html))
-                        self.logger.info(f"Successfully scraped {url}")
-                        return html
+                        # parse the body as it streams in; the tree is shared by link discovery and the extractor
+                        parser = html_feed_parser(response.charset) if parse else None
+                        chunks = []
+                        async for chunk in response.content.iter_chunked(32768):
+                            chunks.append(chunk)
+                            if parser is not None:
+                                parser.feed(chunk)
+                        tree = None
+                        if parser is not None:
+                            try:
+                                tree = parser.close()
+                            except etree.XMLSyntaxError:
+                                pass  # empty document
+                        # keep the body as bytes; lxml/BeautifulSoup detect the encoding themselves
+                        html = b''.join(chunks)
+                        content_type = response.headers.get('Content-Type', 'text/html').split(';')[0].strip().lower()
+                        self.logger.info("Successfully scraped %s", url)
+                        return html, tree, content_type
                     else:
-                        self.logger.error(f"Error fetching {url}: HTTP status {response.status}")
+                        self.logger.error("Error fetching %s: HTTP status %s", url, response.status)
             except aiohttp.ClientConnectorError as e:
-                self.logger.error(f"Connection error for {url}: {str(e)}")
+                # DNS failures surface here now that the connector resolves asynchronously
+                self.logger.error("Connection error for %s: %s", url, e)
             except aiohttp.ClientError as e:
-                self.logger.error(f"Client error for {url}: {str(e)}")
+                self.logger.error("Client error for %s: %s", url, e)
             except asyncio.TimeoutError:
-                self.logger.error(f"Timeout error fetching {url}")
+                self.logger.error("Timeout error fetching %s", url)
             except Exception as e:
-                self.logger.error(f"Unexpected error fetching {url}: {str(e)}")
+                self.logger.error("Unexpected error fetching %s: %s", url, e)
             
             retries += 1
             if retries < max_retries:
                 wait_time = 2 ** retries  # Exponential backoff
-                self.logger.info(f"Retrying {url} in {wait_time} seconds...")
+                self.logger.info("Retrying %s in %s seconds...", url, wait_time)
                 await asyncio.sleep(wait_time)
 
-        self.logger.error(f"Failed to fetch {url} after {max_retries} attempts")
-        return None
+        self.logger.error("Failed to fetch %s after %s attempts", url, max_retries)
+        return None, None, None
 
-    def is_valid_url(self, start_url, url):
-        start_domain = urlparse(start_url).netloc
-        url_domain = urlparse(url).netloc
-        return start_domain == url_domain and url not in self.seen_urls
+    def is_valid_url(self, url):
+        return _split(url).netloc == self._base_domain and url not in self.seen_urls
 
-    async def enqueue_related_urls(self, queue, html, base_url, current_depth):
-        if current_depth >= self.max_depth or len(self.seen_urls) >= self.max_pages_per_domain:
+    def enqueue_related_urls(self, queue, links, base_url, current_depth):
+        """ Queue the relevant, unseen links among `links`, (href, text) pairs from `link_pairs` """
+        if not links or current_depth >= self.max_depth or len(self.seen_urls) >= self.max_pages_per_domain:
             return
 
-        soup = BeautifulSoup(html, 'html.parser')
-        links = soup.find_all('a', href=True)
-        
-        for link in links:
-            url = urljoin(base_url, link['href'])
-            if self.is_valid_url(base_url, url):
-                relevance_score = self.calculate_relevance_score(link, url)
+        parts = urlsplit(base_url)
+        origin = f'{parts.scheme}://{parts.netloc}'
+        seen_this_page = set()
+        for href, link_text in links:
+            # reject in-page anchors and non-HTTP links before paying for urljoin/urlparse
+            href = href.strip()
+            if not href or href[0] in '#?' or href.startswith(('javascript:', 'mailto:', 'tel:')):
+                continue
+            url = resolve_link(base_url, origin, href)
+
+            # header, footer and body often link the same page more than once
+            if url in seen_this_page:
+                continue
+            seen_this_page.add(url)
+
+            if self.is_valid_url(url) and url not in self._bloom:
+                relevance_score = self.calculate_relevance_score(link_text, url)
                 if relevance_score > 0:
-                    await queue.put((100 - relevance_score, url, current_depth + 1))  # Lower score = higher priority
+                    self._bloom.add(url)
+                    queue.put((100 - relevance_score, url, current_depth + 1))  # Lower score = higher priority
 
-    def calculate_relevance_score(self, link, url):
+    def calculate_relevance_score(self, link_text, url):
         relevance_score = 0
         
         # check URL structure
-        url_path = urlparse(url).path.lower()
-        if any(keyword in url_path for keyword in self.relevant_keywords):
+        url_path = _split(url).path.lower()
+        if self._kw_re.search(url_path):
             relevance_score += 5
         
         # check link text
-        link_text = link.text.lower()
-        if any(keyword in link_text for keyword in self.relevant_keywords):
+        if self._kw_re.search(link_text.lower()):
             relevance_score += 3
         
         # prioritize shorter paths
@@ -152,24 +355,60 @@ class AsyncScraper:
         
         return relevance_score
 
-async def main(urls):
-    scraper = AsyncScraper()
-    all_results = {}
-    for url in urls:
+async def main(urls, output=None, processes=None):
+    """ Crawl every start URL concurrently.
+
+    Returns {start_url: {page_url: page_results}}. With `output`, each page is instead appended to that file
+    as one JSON line ({"url": ..., "records": ...}) as soon as it is extracted, and the returned per-start-URL
+    dicts are empty. With `processes`, pages are parsed and extracted in that many worker processes
+    (0 means one per core) instead of on the event loop.
+    """
+    urls = [url if url.startswith('http') else 'http://' + url for url in urls]
+    # every start URL gets its own scraper (frontier, seen set, base domain) but they share one extractor
+    extractor = ContactInfoExtractor()
+    cpu_pool = listener = None
+    if processes is not None:
+        # workers hand their log records to the parent, which alone writes the rotating log files
+        log_queue = multiprocessing.Queue()
+        listener = QueueListener(log_queue, *logging.getLogger().handlers, respect_handler_level=True)
+        listener.start()
+        cpu_pool = ProcessPoolExecutor(max_workers=processes or os.cpu_count(), initializer=init_worker, initargs=(log_queue,))
+
+    async def write_page(url, page_results):
+        await out.write(orjson.dumps({'url': url, 'records': page_results}) + b'\n')
+
+    async def scrape(url):
         try:
-            if not url.startswith('http'):
-                url = 'http://' + url
-            results = await scraper.scrape(url)
-            all_results[url] = results
+            return await AsyncScraper(extractor=extractor, cpu_pool=cpu_pool, sink=write_page if output else None).scrape(session, url)
         except Exception as e:
-            logger.error(f"Error scraping {url}: {str(e)}")
-            all_results[url] = []
-    return all_results
+            logger.error("Error scraping %s: %s", url, e)
+            return []
+
+    # one session (and connection pool) for every start URL; the domains are crawled concurrently
+    connector = aiohttp.TCPConnector(
+        limit=1000, limit_per_host=8, resolver=aiohttp.AsyncResolver(), ttl_dns_cache=300, enable_cleanup_closed=True
+    )
+    try:
+        async with aiohttp.ClientSession(headers=AsyncScraper.headers, connector=connector) as session:
+            if output:
+                async with aiofiles.open(output, 'wb') as out:
+                    results = await asyncio.gather(*(scrape(url) for url in urls))
+            else:
+                results = await asyncio.gather(*(scrape(url) for url in urls))
+    finally:
+        if cpu_pool is not None:
+            cpu_pool.shutdown()
+            listener.stop()
+    return dict(zip(urls, results))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Asynchronous web scraper for contact information.")
     parser.add_argument("urls", nargs="+", help="URLs to scrape")
+    parser.add_argument("-o", "--output", help="stream results to this file as JSON lines instead of printing them at the end")
+    parser.add_argument("-p", "--processes", type=int, nargs="?", const=0,
+                        help="parse and extract pages in this many worker processes (one per core if no number is given)")
     args = parser.parse_args()
 
-    results = asyncio.run(main(args.urls))
-    print(json.dumps(results, indent=2))
\ No newline at end of file
+    results = asyncio.run(main(args.urls, output=args.output, processes=args.processes))
+    if not args.output:
+        sys.stdout.buffer.write(orjson.dumps(results, option=orjson.OPT_INDENT_2) + b'\n')
\ No newline at end of file
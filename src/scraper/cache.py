@@ -0,0 +1,61 @@
+"""
+On-disk cache of downloaded pages.
+Entries keep the server's validators (ETag / Last-Modified) so a later download can revalidate
+with a conditional GET and reuse the cached HTML on `304 Not Modified` instead of rendering again.
+"""
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import diskcache
+
+from src.config import config
+from src.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+def cache_key(url):
+    """ The URL without its fragment, with a lowercase scheme and host and its query parameters sorted """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
+
+class PageCache:
+    def __init__(self, directory=config.HTTP_CACHE_DIR, ttl=config.HTTP_CACHE_TTL):
+        """
+        Args:
+            directory (str): Where the cache's SQLite database and files live
+            ttl (float): Seconds an entry is kept before it is evicted
+        """
+        self.cache = diskcache.Cache(directory)
+        self.ttl = ttl
+
+    def get(self, url):
+        """ The cached entry for `url` ({'html', 'etag', 'last_modified'}), or None """
+        return self.cache.get(cache_key(url))
+
+    def store(self, url, html, headers):
+        """ Cache `html` under `url` with the validators from the response `headers`
+        Pages served without an ETag or Last-Modified can't be revalidated, so they aren't cached.
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if etag is None and last_modified is None:
+            return
+        self.cache.set(cache_key(url), {'html': html, 'etag': etag, 'last_modified': last_modified}, expire=self.ttl)
+        logger.debug("Cached %s", url)
+
+    @staticmethod
+    def conditional_headers(entry):
+        """ Request headers that make a GET conditional on the cached entry having changed """
+        headers = {}
+        if entry is not None:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+@lru_cache(maxsize=None)
+def page_cache():
+    """ The process-wide `PageCache`, opened on first use """
+    return PageCache()
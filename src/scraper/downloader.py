@@ -1,101 +1,371 @@
 import argparse
 import asyncio
 import os
+import sys
+from collections import deque
+from functools import lru_cache
+from itertools import chain
 from sys import platform
+from urllib.parse import urlsplit
 
+import aiohttp
 from aiolimiter import AsyncLimiter
-from PyQt5.QtCore import QUrl
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtWebEngineWidgets import QWebEnginePage
+from async_lru import alru_cache
 
 from src.config import config
+from src.scraper.cache import PageCache, cache_key, page_cache
 from src.utils.logging_utils import setup_logging, get_logger
 
 # configure the logging utility
 setup_logging()
 logger = get_logger(__name__)
 
-class WebkitRenderer(QWebEnginePage):
-    """ Class to render a given URL """
+# trims what every QtWebEngine renderer loads: no GPU process, audio, extensions or /dev/shm backing, and
+# pages share renderer processes. Read when QtWebEngine starts, so it must be set before the first render
+os.environ.setdefault(
+    'QTWEBENGINE_CHROMIUM_FLAGS',
+    '--disable-gpu --disable-software-rasterizer --disable-extensions --mute-audio '
+    '--disable-dev-shm-usage --renderer-process-limit=2'
+)
 
-    def __init__(self, rendered_callback, rate_limiter=None):
+# markup that means a statically served page already has what we scrape, so it needn't be rendered
+CONTENT_MARKERS = ('mailto:', 'team', 'staff', 'contact')
+# the same markers, for pages still held as undecoded bytes
+CONTENT_MARKER_BYTES = tuple(marker.encode('ascii') for marker in CONTENT_MARKERS)
+# only documents a browser would run scripts in can need rendering; JSON, XML, plain text etc. are used as served
+RENDERABLE_TYPES = ('text/html', 'application/xhtml+xml')
+
+@lru_cache(maxsize=None)
+def shared_limiter():
+    """ The process-wide limiter on page loads, so every render in a run draws from the same budget """
+    return AsyncLimiter(config.GLOBAL_RATE_LIMIT, config.GLOBAL_TIME_PERIOD)
+
+@lru_cache(maxsize=None)
+def qt_app():
+    """ The process-wide QApplication; Qt allows only one and it is expensive to start """
+    from PyQt5.QtWidgets import QApplication
+    return QApplication.instance() or QApplication(sys.argv)
+
+def run_with_qt(coro):
+    """ Run `coro` to completion on a qasync event loop
+    Qt events are processed by the asyncio loop itself, so any number of `WebkitRenderer.render` calls
+    progress concurrently instead of each blocking in its own `QApplication.exec_()`.
+    """
+    import qasync
+    loop = qasync.QEventLoop(qt_app())
+    asyncio.set_event_loop(loop)
+    with loop:
+        return loop.run_until_complete(coro)
+
+@lru_cache(maxsize=None)
+def render_profile():
+    """ The off-the-record profile every page renders in
+    Nothing is written to disk (no HTTP cache, no cookies), so long batches don't grow a profile
+    directory, and images aren't fetched since only the markup is scraped.
+    """
+    from PyQt5.QtWebEngineWidgets import QWebEngineProfile, QWebEngineSettings
+    qt_app()
+    profile = QWebEngineProfile()  # no storage name: off the record
+    profile.setHttpCacheType(QWebEngineProfile.NoCache)
+    profile.setPersistentCookiesPolicy(QWebEngineProfile.NoPersistentCookies)
+    profile.settings().setAttribute(QWebEngineSettings.AutoLoadImages, False)
+    return profile
+
+@lru_cache(maxsize=None)
+def renderer_class():
+    """ Build the `WebkitRenderer` class on first use
+    QtWebEngine is only imported when a page actually has to be rendered, so plain aiohttp downloads
+    (and anything importing this module) never pay its start-up time or memory.
+    """
+    from PyQt5.QtCore import QUrl
+    from PyQt5.QtWebEngineWidgets import QWebEnginePage
+
+    class WebkitRenderer(QWebEnginePage):
+        """ Class to render a given URL """
+
+        def __init__(self, rate_limiter=None):
+            """
+            Args:
+                rate_limiter (AsyncLimiter): optional, meters when page loads start.
+            """
+            self.logger = get_logger(self.__class__.__name__)
+            qt_app()  # pages can only be created once the application exists
+            super(WebkitRenderer, self).__init__(render_profile())
+            self.loadFinished.connect(self._loadFinished)
+            self.rate_limiter = rate_limiter
+            self._done = None
+            self.logger.debug("WebkitRenderer initialized")
+
+        def javaScriptConsoleMessage(self, msg_level, p_str, p_int, p_str_1):
+            """ Ignore console messages """
+            pass
+
+        async def render(self, url):
+            """ Download and render the URL
+            Must run on the loop started by `run_with_qt`, which is what delivers the page's Qt signals.
+            Args:
+                url (str): The URL to load.
+            Returns:
+                str: The rendered HTML, or None if the page failed to load
+            """
+            self.logger.info("Rendering URL: %s", url)
+            # resolved by `_finish` once the page has loaded and its HTML has been read back
+            self._done = asyncio.get_running_loop().create_future()
+            if self.rate_limiter:
+                # the limiter meters when loads start; holding it for the whole render would let one slow
+                # page stall every other request
+                async with self.rate_limiter:
+                    self.load(QUrl(url))
+            else:
+                self.load(QUrl(url))
+            return await self._done
+
+        def _loadFinished(self, result):
+            """ Event handler - A Web page finished loading
+            Args:
+                result (bool): success indicator
+            """
+            url = self.url().toString()
+            if result:
+                self.logger.info("Successfully loaded URL: %s", url)
+                self.toHtml(self.html_callback)  # async and takes a callback
+            else:
+                self.logger.error("Failed to load URL: %s", url)
+                self._finish(None)
+
+        def html_callback(self, data):
+            """ Receives rendered Web Page's HTML """
+            url = self.url().toString()
+            if data:
+                self.logger.info("Received HTML for URL: %s", url)
+                self.logger.debug("HTML content length: %d", len(data))
+            else:
+                self.logger.warning("No HTML received for URL: %s", url)
+            self._finish(data)
+
+        def _finish(self, html):
+            """ Hand the result to the `render` call waiting on it """
+            if self._done is not None and not self._done.done():
+                self._done.set_result(html)
+
+    return WebkitRenderer
+
+class BatchRenderer:
+    """ Renders URLs on a fixed pool of reusable `WebkitRenderer` pages
+    All pages share the one QApplication and QtWebEngine's browser process, so start-up is paid once per
+    pool rather than once per URL, and up to `concurrency` pages render at the same time.
+    """
+    def __init__(self, concurrency=8, rate_limiter=None):
         """
         Args:
-            rendered_callback (func): called once a Web page is rendered.
-
-        Callback Args:
-            url (str): The URL of the Web page.
-            html (str): HTML of the rendered Web page.
+            concurrency (int): The number of pages, and so of renders in flight
+            rate_limiter (AsyncLimiter): Meters page loads; defaults to `shared_limiter()`
         """
-        self.logger = get_logger(self.__class__.__name__)
-        self.app = QApplication([])
-        super(WebkitRenderer, self).__init__()
-        self.loadFinished.connect(self._loadFinished)
-        self.rendered_callback = rendered_callback
-        self.rate_limiter = rate_limiter
-        self.logger.debug("WebkitRenderer initialized")
-
-    def javaScriptConsoleMessage(self, msg_level, p_str, p_int, p_str_1):
-        """ Ignore console messages """
-        pass
+        rate_limiter = rate_limiter or shared_limiter()
+        WebkitRenderer = renderer_class()
+        self.pages = [WebkitRenderer(rate_limiter=rate_limiter) for _ in range(concurrency)]
+        self.idle = deque(self.pages)
+        self.semaphore = asyncio.Semaphore(concurrency)
 
     async def render(self, url):
-        """ Download and render the URL
-        Args:
-            url (str): The URL to load.
+        """ Render `url` on the next idle page
+        Returns:
+            str: The rendered HTML, or None if the page failed to load
         """
-        self.logger.info(f"Rendering URL: {url}")
-        if self.rate_limiter:
-            async with self.rate_limiter:
-                self.load(QUrl(url))
-                await asyncio.get_event_loop().run_in_executor(None, self.app.exec_)
-        else:
-            self.load(QUrl(url))
-            self.app.exec()  # put app into infinite loop, listening to signals/events
+        async with self.semaphore:
+            page = self.idle.popleft()
+            try:
+                return await page.render(url)
+            finally:
+                self.idle.append(page)
 
-    def _loadFinished(self, result):
-        """ Event handler - A Web page finished loading
-        Args:
-            result (bool): success indicator
+    async def render_many(self, urls):
+        """ Render every URL, `concurrency` at a time
+        Returns:
+            dict: {url: rendered HTML or None}
         """
-        url = self.url().toString()
-        if result:
-            self.logger.info(f"Successfully loaded URL: {url}")
-            self.toHtml(self.html_callback)  # async and takes a callback
-        else:
-            self.logger.error(f"Failed to load URL: {url}")
-            self.rendered_callback(url, None)
-            self.app.quit()
-
-    def html_callback(self, data):
-        """ Receives rendered Web Page's HTML """
-        url = self.url().toString()
-        if data:
-            self.logger.info(f"Received HTML for URL: {url}")
-            self.logger.debug(f"HTML content length: {len(data)}")
-        else:
-            self.logger.warning(f"No HTML received for URL: {url}")
-        self.rendered_callback(url, data)
-        self.app.quit()  # break app out of infinite loop
+        return dict(zip(urls, await asyncio.gather(*map(self.render, urls))))
+
+@lru_cache(maxsize=None)
+def batch_renderer():
+    """ The process-wide `BatchRenderer`, started the first time a page needs rendering """
+    return BatchRenderer(concurrency=config.RENDER_CONCURRENCY)
+
+def __getattr__(name):
+    # keeps `from src.scraper.downloader import WebkitRenderer` working without an eager Qt import
+    if name == 'WebkitRenderer':
+        return renderer_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+_session = None
+
+def plain_session():
+    """ The process-wide session for plain fetches
+    Sharing it keeps connections alive and DNS answers cached between downloads, so repeat requests to a
+    host skip the lookup and the TCP/TLS handshake. Close it with `close_session()`.
+    """
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=60)
+        _session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=30))
+    return _session
 
-async def download_with_rate_limit(url, rate_limiter):
+async def close_session():
+    if _session is not None:
+        await _session.close()
+
+async def fetch_plain(url, cached=None):
+    """ Download a URL without rendering it
+    Args:
+        url (str): The URL to download
+        cached (dict): The URL's `PageCache` entry, if any; makes the request conditional
+    Returns:
+        (int, str, CIMultiDictProxy): The status, the HTML as served (None unless the status is 200) and the
+            response headers, or (None, None, None) if the request failed
+    """
+    try:
+        async with plain_session().get(url, headers=PageCache.conditional_headers(cached)) as response:
+            if response.status == 304:
+                return response.status, None, response.headers
+            if response.status != 200:
+                logger.warning("Plain fetch of %s returned HTTP status %s", url, response.status)
+                return response.status, None, response.headers
+            return response.status, await response.text(errors='replace'), response.headers
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.warning("Plain fetch of %s failed: %s", url, e)
+        return None, None, None
+
+def needs_render(url, html, content_type='text/html'):
+    """ Whether a plainly fetched page has to be rendered to get at its content
+    Hosts listed in `config.JS_REQUIRED_HOSTS` always are; non-HTML documents never are; otherwise only
+    HTML that doesn't already contain contact/team markup is. `html` may be str or the undecoded body.
+    """
+    if urlsplit(url).hostname in config.JS_REQUIRED_HOSTS:
+        return True
+    if content_type not in RENDERABLE_TYPES:
+        return False
+    lowered = html.lower()
+    markers = CONTENT_MARKER_BYTES if isinstance(lowered, bytes) else CONTENT_MARKERS
+    return not any(marker in lowered for marker in markers)
+
+def write_html(html, sink, chunk_size=65536):
+    """ Write a page to the binary stream `sink` as UTF-8
+    Encoded a slice at a time, so no second full-size copy of the page is ever held.
+    """
+    for start in range(0, len(html), chunk_size):
+        sink.write(html[start:start + chunk_size].encode('utf-8', errors='replace'))
+    sink.write(b'\n')
+
+async def download_with_rate_limit(url, rate_limiter=None, sink=None):
     """ Download a URL with rate limiting
+    Each distinct URL (see `cache_key`) is downloaded successfully at most once per process; repeat and concurrent
+    requests for it share that one download. A failed download isn't remembered, so the next request retries it.
     Args:
         url (str): The URL to download
-        rate_limiter (AsyncLimiter): The rate limiter
+        rate_limiter (AsyncLimiter): Meters the plain fetch; defaults to `shared_limiter()`
+        sink (BinaryIO): Optional stream the HTML is also written to, as UTF-8
     Returns:
-        str: The HTML content of the URL
+        str: The HTML content of the URL, or None if it couldn't be downloaded
+    """
+    try:
+        html = await _download(PageRequest(url), rate_limiter or shared_limiter())
+    except DownloadFailed:
+        return None
+    if sink is not None:
+        write_html(html, sink)
+    return html
+
+async def download_many(urls, concurrency=8, rate_limiter=None, sink=None):
+    """ Download every URL in `urls` with a fixed number of workers
+    Workers take the next URL only when they are free, and each read happens off the event loop, so `urls`
+    can be an open-ended stream such as `sys.stdin`. Blank lines are skipped.
+    Args:
+        urls (iterable): URLs (or lines holding one URL each)
+        concurrency (int): The number of downloads in flight
+        rate_limiter (AsyncLimiter): Passed on to `download_with_rate_limit`
+        sink (BinaryIO): Passed on to `download_with_rate_limit`
     """
+    loop = asyncio.get_running_loop()
+    urls = iter(urls)
+    reading = asyncio.Lock()
+
+    async def next_url():
+        async with reading:
+            while True:
+                line = await loop.run_in_executor(None, next, urls, None)
+                if line is None:
+                    return None
+                if line.strip():
+                    return line.strip()
+
+    async def worker():
+        while True:
+            url = await next_url()
+            if url is None:
+                return
+            try:
+                await download_with_rate_limit(url, rate_limiter, sink)
+            except Exception as e:
+                logger.error("Error downloading %s: %s", url, e, exc_info=True)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+class DownloadFailed(Exception):
+    """ Raised by `_download` instead of returning None, so `alru_cache` doesn't remember the failure """
+
+class PageRequest:
+    """ A URL to download, equal to and hashed as its `cache_key`
+    `alru_cache` memoizes `_download` per normalized URL this way, while the page is still fetched and rendered
+    at the URL exactly as it was given, query order and fragment included.
+    """
+    __slots__ = ('url', 'key')
+
+    def __init__(self, url):
+        self.url = url
+        self.key = cache_key(url)
+
+    def __eq__(self, other):
+        return isinstance(other, PageRequest) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+@alru_cache(maxsize=1024)
+async def _download(request, rate_limiter):
+    url = request.url
     def callback(url, html):
         if html:
-            logger.info(f"Successfully downloaded URL: {url}")
-            logger.debug(f"HTML content length: {len(html)}")
+            logger.info("Successfully downloaded URL: %s", url)
+            logger.debug("HTML content length: %d", len(html))
         else:
-            logger.error(f"Failed to download URL: {url}")
-        print(html.encode('utf-8').decode('utf-8'))
-        
-    wr = WebkitRenderer(callback)
-    await wr.render(url)
+            logger.error("Failed to download URL: %s", url)
+
+    cache = page_cache()
+    cached = cache.get(url)
+    async with rate_limiter:
+        status, html, headers = await fetch_plain(url, cached)
+    if status == 304 and cached is not None:
+        # unchanged since it was cached, so neither the download nor the render needs repeating
+        logger.info("Not modified since cached: %s", url)
+        callback(url, cached['html'])
+        return cached['html']
+
+    # most pages are served complete; only start the browser for ones that build their content with JavaScript
+    content_type = headers.get('Content-Type', 'text/html').split(';')[0].strip().lower() if headers else None
+    if html is not None and not needs_render(url, html, content_type):
+        cache.store(url, html, headers)
+        callback(url, html)
+        return html
+
+    html = await batch_renderer().render(url)
+    callback(url, html)
+    if html and status == 200:
+        # the served document's validators still tell whether the rendered page is current
+        cache.store(url, html, headers)
+    if not html:
+        # a transient error or timeout; the next request for this URL tries again
+        raise DownloadFailed(url)
+    return html
 
 if __name__ == '__main__':
     if platform == 'darwin':  # if mac: hide python launch icons
@@ -105,19 +375,23 @@ if __name__ == '__main__':
     # render_engine.py needs to be able to run as a
     # standalone script to achieve parallelization.
     parser = argparse.ArgumentParser()
-    parser.add_argument('url', type=str)
+    parser.add_argument('urls', type=str, nargs='*')
+    parser.add_argument('--stdin', action='store_true', help='also read URLs from stdin, one per line')
     args = parser.parse_args()
+    if not args.urls and not args.stdin:
+        parser.error('give at least one URL or --stdin')
     
-    # Create a rate limiter when running as a standalone script
-    rate_limiter = AsyncLimiter(config.GLOBAL_RATE_LIMIT, config.GLOBAL_TIME_PERIOD)
-    
-    def cb(url, html):
-        if html:
-            logger.info(f"Successfully rendered URL: {url}")
-            logger.debug(f"HTML content length: {len(html)}")
-        else:
-            logger.error(f"Failed to render URL: {url}")
-        print(html.encode('utf-8').decode('utf-8'))
-        
-    logger.info(f"Starting rendering for URL: {args.url}")
-    asyncio.run(download_with_rate_limit(args.url, rate_limiter))
\ No newline at end of file
+    # the same limiter the renderers use, so every download in the run shares one budget
+    rate_limiter = shared_limiter()
+
+    async def download_all(urls):
+        # every URL shares one process, limiter, cache and pool of pages, so QtWebEngine starts once for the run
+        try:
+            # pages go straight to stdout as bytes, whatever the console's encoding
+            await download_many(urls, concurrency=config.RENDER_CONCURRENCY, rate_limiter=rate_limiter, sink=sys.stdout.buffer)
+        finally:
+            await close_session()
+
+    logger.info("Starting rendering")
+    # Qt and asyncio share one loop, so renders don't each need their own blocking Qt event loop
+    run_with_qt(download_all(chain(args.urls, sys.stdin) if args.stdin else args.urls))
\ No newline at end of file
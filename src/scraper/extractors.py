@@ -1,12 +1,19 @@
-import json
+import hashlib
+import heapq
+import orjson
 import sys
 import os
 import re
 from abc import ABC, abstractmethod
-from bs4 import BeautifulSoup
+from functools import lru_cache
+import ahocorasick
+import lxml.html
+import numpy as np
+import re2
+from lxml import etree
 from urllib.parse import urljoin
-from fuzzywuzzy import process
-from collections import defaultdict
+from rapidfuzz import fuzz, process, utils
+from collections import OrderedDict, defaultdict
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.utils.logging_utils import setup_logging, get_logger
@@ -15,6 +22,167 @@ setup_logging()
 logger = get_logger(__name__)
 
 MIN_QUERY_LENGTH = 3
+# texts up to this long are memoized: headers, footers and nav blocks repeat on every page of a site, whole page texts rarely do
+TEXT_CACHE_MAX_LENGTH = 4096
+# pages whose results ContactInfoExtractor remembers, by content hash
+RESULT_CACHE_SIZE = 10000
+
+# compiled once at import; every extractor instance shares them
+# bounded runs fenced by lookarounds: a long run of address characters with no valid match fails fast instead of backtracking
+EMAIL_PATTERN = re.compile(r'(?<![A-Za-z0-9._%+-])[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,255}\.[A-Za-z]{2,24}(?![A-Za-z0-9-])', re.ASCII)
+# a name is 2-6 capitalised words of at most 31 letters; the bounds cap how far a failed attempt can backtrack
+NAME_PATTERN = re.compile(r'\b(?!(?:Email|Contact|sent by)\b)(?:Dr\.|Mr\.|Ms\.|Mrs\.|Prof\.)?\s*([A-Z][a-z]{1,30}(?:\s+[A-Z][a-z]{1,30}){1,5})\b')
+# patterns without lookarounds go to RE2, whose automaton matches in linear time however much a pattern
+# would make `re` backtrack (the email and name patterns need lookarounds, which RE2 doesn't support)
+PHONE_PATTERN = re2.compile(r'\+?[\d\s.-]+\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}')
+
+# the list repeats some keywords; dict.fromkeys drops the repeats and keeps the order
+TITLE_KEYWORDS = list(dict.fromkeys([
+    'CEO', 'CTO', 'CFO', 'COO', 'President', 'Director', 'Chief', 'Strategist', 'Logistics',
+    'Manager', 'Engineer', 'Developer', 'Designer', 'Analyst', 'Specialist', 'Supply Chain',
+    'Coordinator', 'Administrator', 'Supervisor', 'Lead', 'Head', 'VP', 'Production',
+    'Pilot', 'Technician', 'Scientist', 'Inspector', 'Consultant', 'Architect', 'Assistant',
+    'Associate', 'Operator', 'Instructor', 'Planner', 'Estimator', 'Fabricator',
+    'Assembler', 'Machinist', 'Welder', 'Mechanic', 'Tester', 'Trainer', 'Project',
+    'Marketing', 'Systems', 'Avionics', 'Researcher', 'Flight', 'Manufacturing',
+    'Investigator', 'Quality', 'Assurance', 'Service', 'Support', 'Relations', 'Compliance',
+    'Electrical', 'IT', 'Structural', 'Mechanical', 'Aerospace', 'Business', 'Sales', 'HR',
+    'Recruiter', 'Recruitment', 'Materials', 'Safety', 'Reliability', 'Research',
+    'Field Service', 'Cybersecurity', 'Ordnance', 'Legal Counsel', 'Maintenance',
+    'Agent', 'Human Resources', 'Procurement', 'Operations', 'Business Development',
+    'Integration', 'Mission', 'Payload', 'Propulsion', 'Dr.', 'Regulatory Affairs',
+    'Internal Affairs', 'External Affairs', 'Public Relations', 'Acquisition', 'Configuration',
+    'Risk', 'Test', 'Calibration', 'Inventory', 'Contractor', 'Talent', 'Training', 'Officer',
+    'Compliance Officer', 'Legal Advisor', 'Technical Lead', 'Data Scientist', 'Data Engineer',
+    'Product Manager', 'Product Owner', 'Program Manager', 'Scrum Master', 'Product Designer',
+    'User Experience', 'UX', 'UI', 'Security', 'Infrastructure', 'DevOps', 'Cloud', 'AI',
+    'Machine Learning', 'Artificial Intelligence', 'Big Data', 'Data Analyst', 'Data Architect',
+    'Solutions Architect', 'Enterprise Architect', 'Chief Information Officer', 'CIO',
+    'Chief Security Officer', 'CSO', 'Chief Data Officer', 'CDO', 'Chief Technology Officer', 
+    'Chief Marketing Officer', 'CMO', 'Chief Operations Officer', 'Chief Revenue Officer', 'CRO',
+    'Chief Financial Officer', 'Financial Analyst', 'Investment Analyst', 'Portfolio Manager', 
+    'Account Manager', 'Account Executive', 'Sales Executive', 'Sales Manager', 'Sales Director', 
+    'Customer Success', 'Customer Support', 'Client Services', 'Partner Manager', 'Channel Manager', 
+    'Vendor Manager', 'Supplier Manager', 'Procurement Specialist', 'Logistics Coordinator', 'Logistics Manager', 
+    'Supply Chain Manager', 'Supply Chain Analyst', 'Material Planner', 'Material Manager', 'Material Coordinator', 
+    'Warehouse Manager', 'Warehouse Supervisor', 'Operations Manager', 'Operations Coordinator', 
+    'Operations Analyst', 'Operations Director', 'Human Resources Manager', 'HR Coordinator', 'HR Analyst', 
+    'Talent Acquisition', 'Learning and Development', 'L&D', 'Employee Relations', 'Compensation and Benefits', 
+    'Payroll Specialist', 'Payroll Manager', 'Risk Management', 'Compliance Manager', 'Internal Auditor', 
+    'External Auditor', 'Financial Controller', 'Finance Director', 'Finance Manager', 'Budget Analyst', 
+    'Financial Planner', 'Business Analyst', 'Business Intelligence', 'BI', 'BI Analyst', 'IT Manager', 
+    'IT Director', 'Chief Digital Officer', 'Digital Transformation', 'Digital Marketing', 'SEO', 'SEM', 
+    'Content Manager', 'Content Strategist', 'Content Creator', 'Social Media Manager', 'Social Media Strategist', 
+    'Creative Director', 'Art Director', 'Copywriter', 'Content Writer', 'Editor', 'Proofreader', 'Technical Writer',
+    'Software Engineer', 'Software Developer', 'Frontend Developer', 'Backend Developer', 'Full Stack Developer', 
+    'Mobile Developer', 'iOS Developer', 'Android Developer', 'Web Developer', 'Game Developer', 
+    'Embedded Systems Engineer', 'Hardware Engineer', 'Firmware Engineer', 'Network Engineer', 
+    'Systems Administrator', 'IT Support', 'Help Desk', 'Technical Support', 'Customer Support Engineer', 
+    'Service Desk', 'Field Technician', 'Site Reliability Engineer', 'Security Analyst', 'Security Engineer', 
+    'Penetration Tester', 'Ethical Hacker', 'Security Consultant', 'Security Architect', 'Compliance Analyst', 
+    'Regulatory Compliance', 'Data Protection Officer', 'DPO', 'General Counsel', 'Paralegal', 'Legal Assistant', 
+    'Litigation Support', 'Contract Manager', 'Contract Administrator', 'Patent Agent', 'Patent Attorney', 
+    'Trademark Attorney', 'Real Estate Manager', 'Property Manager', 'Facility Manager', 'Maintenance Technician', 
+    'Maintenance Manager', 'Facilities Coordinator', 'Building Services', 'Environmental Health and Safety', 
+    'EHS', 'Safety Officer', 'Safety Manager', 'HSE', 'Health and Safety', 'Construction Manager', 
+    'Construction Engineer', 'Site Manager', 'Site Engineer', 'Project Coordinator', 'Project Manager', 
+    'Senior Project Manager', 'Program Director', 'PMO', 'Change Manager', 'Organizational Change', 
+    'Transformation Manager', 'Business Transformation', 'Business Process Analyst', 'Process Engineer', 
+    'Continuous Improvement', 'Lean Manufacturing', 'Six Sigma', 'Agile Coach', 'Product Director', 'R&D', 
+    'Research and Development', 'Innovation Manager', 'Innovation Director', 'Principal Engineer', 
+    'Senior Engineer', 'Lead Engineer', 'Field Engineer', 'Field Service Engineer', 'Applications Engineer', 
+    'Application Support', 'Technical Account Manager', 'TAM', 'Customer Engineer', 'Customer Success Manager', 
+    'Customer Experience', 'CX', 'Client Relations', 'Client Success', 'Business Development Manager', 
+    'BDM', 'Sales Engineer', 'Pre-Sales', 'Post-Sales', 'Technical Sales', 'Solution Engineer', 
+    'Solution Architect', 'Solution Consultant', 'Implementation Specialist', 'Implementation Manager', 
+    'Customer Implementation', 'Customer Onboarding', 'Customer Training', 'Training Manager', 'L&D Manager', 
+    'Learning Specialist', 'Talent Development', 'Employee Development', 'Organizational Development', 'OD', 
+    'HR Business Partner', 'HR Generalist', 'HR Specialist', 'HR Advisor', 'HR Consultant', 'HR Director', 
+    'Chief People Officer', 'CPO', 'People Operations', 'People Manager', 'People Director', 'Talent Manager', 
+    'Recruitment Manager', 'Recruitment Consultant', 'Headhunter', 'Executive Search', 'Talent Scout', 
+    'Recruitment Specialist', 'Resourcing', 'Staffing', 'Workforce Planning', 'Workforce Manager', 'HRIS', 
+    'HR Information Systems', 'HR Systems', 'HR Technology', 'Compensation Analyst', 'Benefits Manager', 
+    'Reward Analyst', 'Reward Manager', 'Benefits Analyst', 'Employee Benefits', 'Labor Relations', 
+    'Industrial Relations', 'Union Representative', 'Employee Engagement', 'Employee Experience', 
+    'Wellness Manager', 'Wellbeing Manager', 'Corporate Social Responsibility', 'CSR', 'Diversity and Inclusion', 
+    'D&I', 'Diversity Officer', 'Inclusion Officer', 'Ethics Officer', 'Code of Conduct', 'Governance', 
+    'Board Director', 'Board Member', 'Non-Executive Director', 'Trustee', 'Chairperson', 'Vice Chairperson', 
+    'Board Secretary', 'Audit Committee', 'Remuneration Committee', 'Nomination Committee', 'Risk Committee', 
+    'Governance Committee', 'Advisory Board', 'Technical Advisor', 'Industry Expert', 'Consulting Engineer', 
+    'Senior Consultant', 'Management Consultant', 'Strategy Consultant', 'Advisory Consultant', 
+    'Business Consultant', 'Financial Consultant', 'IT Consultant', 'Technology Consultant', 'Systems Consultant', 
+    'Engineering Consultant', 'Project Consultant', 'Sales Consultant', 'Marketing Consultant', 'Training Consultant',
+    'Learning Consultant', 'Development Consultant', 'Organizational Consultant', 'Operations Consultant', 'Process Consultant',
+    'Change Consultant', 'Transformation Consultant', 'Lean Consultant', 'Six Sigma Consultant', 'Agile Consultant',
+    'Scrum Consultant', 'Product Consultant', 'Program Consultant', 'Innovation Consultant', 'Research Consultant', 
+    'Data Consultant', 'Compliance Consultant', 'Regulatory Consultant', 'Legal Consultant', 'Contracts Manager',
+    'Contracts Specialist', 'Bid Manager', 'Proposal Manager', 'Procurement Officer', 'Procurement Manager',
+    'Purchasing Manager', 'Supply Chain Director', 'Logistics Director', 'Inventory Manager', 'Stock Manager',
+    'Materials Manager', 'Demand Planner', 'Demand Manager', 'Factory Manager', 'Manufacturing Manager',
+    'Production Manager', 'Production Supervisor', 'Production Coordinator', 'Maintenance Supervisor',
+    'Maintenance Engineer', 'Reliability Engineer', 'Asset Manager', 'Asset Engineer', 'Plant Manager',
+    'Facilities Manager'
+]))
+
+# normalised once (lowercased, punctuation stripped) so fuzzy matching doesn't redo it for every keyword on every page
+PROCESSED_TITLE_KEYWORDS = [utils.default_process(keyword) for keyword in TITLE_KEYWORDS]
+
+# every keyword in one Aho-Corasick automaton, so text is scanned once for all of them at the same time
+TITLE_AUTOMATON = ahocorasick.Automaton()
+for keyword in TITLE_KEYWORDS:
+    TITLE_AUTOMATON.add_word(keyword.lower(), len(keyword.lower()))
+TITLE_AUTOMATON.make_automaton()
+
+CONTEXT_KEYWORDS = {
+    'high': ['about', 'team', 'contact', 'leadership', 'management', 'staff', 'employees', 'board', 'executives'],
+    'medium': ['directory', 'people', 'department', 'faculty', 'personnel', 'crew', 'members', 'positions', 'roles'],
+    'low': ['company', 'organization', 'group', 'division', 'unit', 'leaders', 'managers']
+}
+# one alternation per weight, so a container's class/id is tested against each weight in a single search
+CONTEXT_WEIGHT_PATTERNS = {
+    weight: re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+    for weight, keywords in CONTEXT_KEYWORDS.items()
+}
+ANY_CONTEXT_KEYWORD_PATTERN = re.compile('|'.join(pattern.pattern for pattern in CONTEXT_WEIGHT_PATTERNS.values()), re.IGNORECASE)
+CONTEXT_CONTAINER_TAGS = ['div', 'section', 'article', 'aside', 'header', 'footer']
+# tags whose whitespace BeautifulSoup keeps as written
+WHITESPACE_PRESERVING_TAGS = ('pre', 'textarea')
+# hCard classes inside a `vcard` and the result type each becomes
+VCARD_FIELDS = [('fn', 'name'), ('org', 'organization'), ('email', 'email'), ('tel', 'phone')]
+
+def has_class(name):
+    """XPath predicate for elements whose class attribute contains the token the XPath expression `name` gives."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), concat(' ', {name}, ' '))"
+
+def _clean_text(text):
+    # str.split() with no separator collapses whitespace runs and trims the ends, without the regex engine
+    cleaned = ' '.join(text.split())
+    
+    if not cleaned:
+        # self.logger.warning(f"Cleaning resulted in empty string. Reverted to original: '{text}'")
+        return text  # Return original text if cleaning results in empty string
+    
+    #self.logger.debug(f"Cleaned text. Original length: {len(text)}, Clean length: {len(cleaned)} | Clean Text: {cleaned}")
+    return cleaned
+
+# a module-level cache, since lru_cache on a method would keep every extractor alive
+_clean_text_cached = lru_cache(maxsize=4096)(_clean_text)
+
+@lru_cache(maxsize=4096)
+def _findall_cached(pattern, text):
+    """`pattern.findall(text)` as a tuple, remembered for repeated texts."""
+    return tuple(pattern.findall(text))
+
+def is_word_char(ch):
+    """Whether `\w` matches `ch` in a str pattern: any Unicode letter or digit, or `_`."""
+    return ch.isalnum() or ch == '_'
+
+def is_word_boundary(text, index):
+    """Whether `\b` would match just before `text[index]`."""
+    before = index > 0 and is_word_char(text[index - 1])
+    after = index < len(text) and is_word_char(text[index])
+    return before != after
+
 
 class BaseExtractor(ABC):
     def __init__(self):
@@ -26,32 +194,43 @@ class BaseExtractor(ABC):
 
     def clean_text(self, text):
         """Remove extra whitespace and normalize text."""
-        cleaned = re.sub(r'\s+', ' ', text).strip()
-        
-        if not cleaned:
-            # self.logger.warning(f"Cleaning resulted in empty string. Reverted to original: '{text}'")
-            return text  # Return original text if cleaning results in empty string
-        
-        #self.logger.debug(f"Cleaned text. Original length: {len(text)}, Clean length: {len(cleaned)} | Clean Text: {cleaned}")
-        return cleaned
+        if len(text) <= TEXT_CACHE_MAX_LENGTH:
+            return _clean_text_cached(text)
+        return _clean_text(text)
     
     def find_all_matches(self, pattern, text):
         """Find all matches of a regex pattern in the text."""
         if not text:
             # self.logger.warning("Text for find_all_matches is empty. No matches found.")
             return []
-        matches = re.findall(pattern, text)
+        # extractors pass compiled (re or RE2) patterns; calling them directly skips re's per-call cache lookup
+        if isinstance(pattern, str):
+            matches = re.findall(pattern, text)
+        else:
+            matches = pattern.findall(text)
         #self.logger.debug(f"Found {len(matches)} matches for pattern in text: {text}")
         return matches
 
+    def _ensure_str(self, content):
+        """Return `content` as a string, joining lists with spaces."""
+        if isinstance(content, str):
+            return content
+        self.logger.debug("Content received was not a string (type: %s). Converting to string.", type(content))
+        if isinstance(content, list):
+            return ' '.join(map(str, content))  # Convert list elements to strings and join
+        return str(content)
+
     def log_extraction(self, content_type, results):
         """Log the results of an extraction."""
         # self.logger.info(f"Extracted {len(results)} {content_type}(s)")
         for result in results:
-            self.logger.info(f"Extracted {content_type}: {result['value']}")
+            self.logger.info("Extracted %s: %s", content_type, result['value'])
 
     def safe_extract(self, content):
         """Safely perform extraction with error handling."""
+        if content:
+            # converted once here, so each `extract` can assume a string
+            content = self._ensure_str(content)
         if not content or len(content) < MIN_QUERY_LENGTH:
             # self.logger.warning(f"Content too short for extraction: {content}")
             return [{'type': self.__class__.__name__.replace('Extractor', '').lower(), 'value': 'not_found'}]
@@ -60,66 +239,44 @@ class BaseExtractor(ABC):
             self.log_extraction(self.__class__.__name__.replace('Extractor', '').lower(), results)
             return results
         except Exception as e:
-            self.logger.error(f"Error during extraction: {str(e)}")
+            self.logger.error("Error during extraction: %s", e)
             return content
 
 
 class EmailExtractor(BaseExtractor):
     def __init__(self):
         super().__init__()
-        self.email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+        self.email_pattern = EMAIL_PATTERN
 
     def extract(self, content):
         #self.logger.debug(f"Extracting emails from content (length: {len(content)}): {content}")
-        
-        # Ensure the content is always a string
-        if not isinstance(content, str):
-            self.logger.info(f"Content received was not a string (type: {type(content)}). Converted to string.")
-            if isinstance(content, list):
-                content = ' '.join(map(str, content))  # Convert list elements to strings and join
-            else:
-                content = str(content)  # Convert other types to string
-            # self.logger.info("Content converted to string.")
-            
         cleaned_content = self.clean_text(content)
         # self.logger.info(f"Cleaned Email: {cleaned_content}")
         emails = self.find_all_matches(self.email_pattern, cleaned_content)
-        self.logger.info(f"Emails Matched: {len(emails)} emails.")
+        self.logger.info("Emails Matched: %d emails.", len(emails))
         return [{'type': 'email', 'value': email} for email in emails]
 
 
 class FullNameExtractor(BaseExtractor):
     def __init__(self):
-        self.name_pattern = re.compile(r'\b(?!(?:Email|Contact|sent by)\b)(?:Dr\.|Mr\.|Ms\.|Mrs\.|Prof\.)?\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\b')
+        self.name_pattern = NAME_PATTERN
         super().__init__()  # Ensure BaseExtractor's constructor is called
         
     def extract(self, content):
-        # Ensure the content is always a string
-        if not isinstance(content, str):
-            self.logger.debug(f"Content received was not a string (type: {type(content)}). Converting to string.")
-            if isinstance(content, list):
-                content = ' '.join(map(str, content))  # Convert list elements to strings and join
-            else:
-                content = str(content)  # Convert other types to string
-
-        matches = self.name_pattern.findall(content)
+        # the same "Contact Us" or footer block feeds every page, so short texts reuse their earlier matches
+        if len(content) <= TEXT_CACHE_MAX_LENGTH:
+            matches = _findall_cached(self.name_pattern, content)
+        else:
+            matches = self.name_pattern.findall(content)
         return [{'type': 'name', 'value': name.strip()} for name in matches]
 
 
 class PhoneExtractor(BaseExtractor):
     def __init__(self):
         super().__init__()
-        self.phone_pattern = r'\+?[\d\s.-]+\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}'
+        self.phone_pattern = PHONE_PATTERN
 
     def extract(self, content):
-        # Ensure the content is always a string
-        if not isinstance(content, str):
-            self.logger.debug(f"Content received was not a string (type: {type(content)}). Converting to string.")
-            if isinstance(content, list):
-                content = ' '.join(map(str, content))  # Convert list elements to strings and join
-            else:
-                content = str(content)  # Convert other types to string
-
         cleaned_content = self.clean_text(content)
         phone_numbers = self.find_all_matches(self.phone_pattern, cleaned_content)
         return [{'type': 'phone', 'value': phone.strip()} for phone in phone_numbers]
@@ -128,107 +285,14 @@ class PhoneExtractor(BaseExtractor):
 class TitleExtractor(BaseExtractor):
     def __init__(self):
         super().__init__()
-        self.title_keywords = [
-            'CEO', 'CTO', 'CFO', 'COO', 'President', 'Director', 'Chief', 'Strategist', 'Logistics',
-            'Manager', 'Engineer', 'Developer', 'Designer', 'Analyst', 'Specialist', 'Supply Chain',
-            'Coordinator', 'Administrator', 'Supervisor', 'Lead', 'Head', 'VP', 'Production',
-            'Pilot', 'Technician', 'Scientist', 'Inspector', 'Consultant', 'Architect', 'Assistant',
-            'Associate', 'Operator', 'Instructor', 'Planner', 'Estimator', 'Fabricator',
-            'Assembler', 'Machinist', 'Welder', 'Mechanic', 'Tester', 'Trainer', 'Project',
-            'Marketing', 'Systems', 'Avionics', 'Researcher', 'Flight', 'Manufacturing',
-            'Investigator', 'Quality', 'Assurance', 'Service', 'Support', 'Relations', 'Compliance',
-            'Electrical', 'IT', 'Structural', 'Mechanical', 'Aerospace', 'Business', 'Sales', 'HR',
-            'Recruiter', 'Recruitment', 'Materials', 'Safety', 'Reliability', 'Research',
-            'Field Service', 'Cybersecurity', 'Ordnance', 'Legal Counsel', 'Maintenance',
-            'Agent', 'Human Resources', 'Procurement', 'Operations', 'Business Development',
-            'Integration', 'Mission', 'Payload', 'Propulsion', 'Dr.', 'Regulatory Affairs',
-            'Internal Affairs', 'External Affairs', 'Public Relations', 'Acquisition', 'Configuration',
-            'Risk', 'Test', 'Calibration', 'Inventory', 'Contractor', 'Talent', 'Training', 'Officer',
-            'Compliance Officer', 'Legal Advisor', 'Technical Lead', 'Data Scientist', 'Data Engineer',
-            'Product Manager', 'Product Owner', 'Program Manager', 'Scrum Master', 'Product Designer',
-            'User Experience', 'UX', 'UI', 'Security', 'Infrastructure', 'DevOps', 'Cloud', 'AI',
-            'Machine Learning', 'Artificial Intelligence', 'Big Data', 'Data Analyst', 'Data Architect',
-            'Solutions Architect', 'Enterprise Architect', 'Chief Information Officer', 'CIO',
-            'Chief Security Officer', 'CSO', 'Chief Data Officer', 'CDO', 'Chief Technology Officer', 
-            'Chief Marketing Officer', 'CMO', 'Chief Operations Officer', 'Chief Revenue Officer', 'CRO',
-            'Chief Financial Officer', 'Financial Analyst', 'Investment Analyst', 'Portfolio Manager', 
-            'Account Manager', 'Account Executive', 'Sales Executive', 'Sales Manager', 'Sales Director', 
-            'Customer Success', 'Customer Support', 'Client Services', 'Partner Manager', 'Channel Manager', 
-            'Vendor Manager', 'Supplier Manager', 'Procurement Specialist', 'Logistics Coordinator', 'Logistics Manager', 
-            'Supply Chain Manager', 'Supply Chain Analyst', 'Material Planner', 'Material Manager', 'Material Coordinator', 
-            'Warehouse Manager', 'Warehouse Supervisor', 'Operations Manager', 'Operations Coordinator', 
-            'Operations Analyst', 'Operations Director', 'Human Resources Manager', 'HR Coordinator', 'HR Analyst', 
-            'Talent Acquisition', 'Learning and Development', 'L&D', 'Employee Relations', 'Compensation and Benefits', 
-            'Payroll Specialist', 'Payroll Manager', 'Risk Management', 'Compliance Manager', 'Internal Auditor', 
-            'External Auditor', 'Financial Controller', 'Finance Director', 'Finance Manager', 'Budget Analyst', 
-            'Financial Planner', 'Business Analyst', 'Business Intelligence', 'BI', 'BI Analyst', 'IT Manager', 
-            'IT Director', 'Chief Digital Officer', 'Digital Transformation', 'Digital Marketing', 'SEO', 'SEM', 
-            'Content Manager', 'Content Strategist', 'Content Creator', 'Social Media Manager', 'Social Media Strategist', 
-            'Creative Director', 'Art Director', 'Copywriter', 'Content Writer', 'Editor', 'Proofreader', 'Technical Writer',
-            'Software Engineer', 'Software Developer', 'Frontend Developer', 'Backend Developer', 'Full Stack Developer', 
-            'Mobile Developer', 'iOS Developer', 'Android Developer', 'Web Developer', 'Game Developer', 
-            'Embedded Systems Engineer', 'Hardware Engineer', 'Firmware Engineer', 'Network Engineer', 
-            'Systems Administrator', 'IT Support', 'Help Desk', 'Technical Support', 'Customer Support Engineer', 
-            'Service Desk', 'Field Technician', 'Site Reliability Engineer', 'Security Analyst', 'Security Engineer', 
-            'Penetration Tester', 'Ethical Hacker', 'Security Consultant', 'Security Architect', 'Compliance Analyst', 
-            'Regulatory Compliance', 'Data Protection Officer', 'DPO', 'General Counsel', 'Paralegal', 'Legal Assistant', 
-            'Litigation Support', 'Contract Manager', 'Contract Administrator', 'Patent Agent', 'Patent Attorney', 
-            'Trademark Attorney', 'Real Estate Manager', 'Property Manager', 'Facility Manager', 'Maintenance Technician', 
-            'Maintenance Manager', 'Facilities Coordinator', 'Building Services', 'Environmental Health and Safety', 
-            'EHS', 'Safety Officer', 'Safety Manager', 'HSE', 'Health and Safety', 'Construction Manager', 
-            'Construction Engineer', 'Site Manager', 'Site Engineer', 'Project Coordinator', 'Project Manager', 
-            'Senior Project Manager', 'Program Director', 'PMO', 'Change Manager', 'Organizational Change', 
-            'Transformation Manager', 'Business Transformation', 'Business Process Analyst', 'Process Engineer', 
-            'Continuous Improvement', 'Lean Manufacturing', 'Six Sigma', 'Agile Coach', 'Product Director', 'R&D', 
-            'Research and Development', 'Innovation Manager', 'Innovation Director', 'Principal Engineer', 
-            'Senior Engineer', 'Lead Engineer', 'Field Engineer', 'Field Service Engineer', 'Applications Engineer', 
-            'Application Support', 'Technical Account Manager', 'TAM', 'Customer Engineer', 'Customer Success Manager', 
-            'Customer Experience', 'CX', 'Client Relations', 'Client Success', 'Business Development Manager', 
-            'BDM', 'Sales Engineer', 'Pre-Sales', 'Post-Sales', 'Technical Sales', 'Solution Engineer', 
-            'Solution Architect', 'Solution Consultant', 'Implementation Specialist', 'Implementation Manager', 
-            'Customer Implementation', 'Customer Onboarding', 'Customer Training', 'Training Manager', 'L&D Manager', 
-            'Learning Specialist', 'Talent Development', 'Employee Development', 'Organizational Development', 'OD', 
-            'HR Business Partner', 'HR Generalist', 'HR Specialist', 'HR Advisor', 'HR Consultant', 'HR Director', 
-            'Chief People Officer', 'CPO', 'People Operations', 'People Manager', 'People Director', 'Talent Manager', 
-            'Recruitment Manager', 'Recruitment Consultant', 'Headhunter', 'Executive Search', 'Talent Scout', 
-            'Recruitment Specialist', 'Resourcing', 'Staffing', 'Workforce Planning', 'Workforce Manager', 'HRIS', 
-            'HR Information Systems', 'HR Systems', 'HR Technology', 'Compensation Analyst', 'Benefits Manager', 
-            'Reward Analyst', 'Reward Manager', 'Benefits Analyst', 'Employee Benefits', 'Labor Relations', 
-            'Industrial Relations', 'Union Representative', 'Employee Engagement', 'Employee Experience', 
-            'Wellness Manager', 'Wellbeing Manager', 'Corporate Social Responsibility', 'CSR', 'Diversity and Inclusion', 
-            'D&I', 'Diversity Officer', 'Inclusion Officer', 'Ethics Officer', 'Code of Conduct', 'Governance', 
-            'Board Director', 'Board Member', 'Non-Executive Director', 'Trustee', 'Chairperson', 'Vice Chairperson', 
-            'Board Secretary', 'Audit Committee', 'Remuneration Committee', 'Nomination Committee', 'Risk Committee', 
-            'Governance Committee', 'Advisory Board', 'Technical Advisor', 'Industry Expert', 'Consulting Engineer', 
-            'Senior Consultant', 'Management Consultant', 'Strategy Consultant', 'Advisory Consultant', 
-            'Business Consultant', 'Financial Consultant', 'IT Consultant', 'Technology Consultant', 'Systems Consultant', 
-            'Engineering Consultant', 'Project Consultant', 'Sales Consultant', 'Marketing Consultant', 'Training Consultant',
-            'Learning Consultant', 'Development Consultant', 'Organizational Consultant', 'Operations Consultant', 'Process Consultant',
-            'Change Consultant', 'Transformation Consultant', 'Lean Consultant', 'Six Sigma Consultant', 'Agile Consultant',
-            'Scrum Consultant', 'Product Consultant', 'Program Consultant', 'Innovation Consultant', 'Research Consultant', 
-            'Data Consultant', 'Compliance Consultant', 'Regulatory Consultant', 'Legal Consultant', 'Contracts Manager',
-            'Contracts Specialist', 'Bid Manager', 'Proposal Manager', 'Procurement Officer', 'Procurement Manager',
-            'Purchasing Manager', 'Supply Chain Director', 'Logistics Director', 'Inventory Manager', 'Stock Manager',
-            'Materials Manager', 'Demand Planner', 'Demand Manager', 'Factory Manager', 'Manufacturing Manager',
-            'Production Manager', 'Production Supervisor', 'Production Coordinator', 'Maintenance Supervisor',
-            'Maintenance Engineer', 'Reliability Engineer', 'Asset Manager', 'Asset Engineer', 'Plant Manager',
-            'Facilities Manager'
-        ]
-        self.title_pattern = re.compile(r'\b(' + '|'.join(self.title_keywords) + r')\b', re.IGNORECASE)
+        self.title_keywords = TITLE_KEYWORDS
+        self.processed_title_keywords = PROCESSED_TITLE_KEYWORDS
+        self.title_automaton = TITLE_AUTOMATON
 
     def extract(self, content):
         # self.logger.debug(f"Extracting Titles from content (length: {len(content)})")
-        if not isinstance(content, str):
-            self.logger.info(f"Title content recieved was not type: `str` in TitleExtractor.")
-        if isinstance(content, list):
-            content = ' '.join(map(str, content)) # Convert all elements to strings and join them
-            # self.logger.info("List Converted to string.")
-        else:
-            content = str(content)
-            # self.logger.info(f"{type(content)} converted to string.")
-        
         cleaned_content = self.clean_text(content)
-        exact_matches = self.find_all_matches(self.title_pattern, cleaned_content)
+        exact_matches = self.find_titles(cleaned_content)
         fuzzy_matches = self.fuzzy_match_titles(cleaned_content)
         # score = 1.1
         # the Title Extractor is the only
@@ -236,21 +300,47 @@ class TitleExtractor(BaseExtractor):
         # results.extend([{'type': 'title', 'value': title,} for title, score in fuzzy_matches])        
         results = [{'type': 'title', 'value': title} for title in exact_matches]
         results.extend([{'type': 'title', 'value': title} for title, _ in fuzzy_matches])
-        self.logger.info(f"Found {len(results)} Titles.")
+        self.logger.info("Found %d Titles.", len(results))
         return results
 
+    def find_titles(self, text):
+        """Keywords found in `text` as whole words, as written there; leftmost first, the longest at each position."""
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # a few characters lowercase to two; keep the offsets lined up with `text`
+            lowered = ''.join(char.lower() if len(char.lower()) == 1 else char for char in text)
+        hits = []
+        for end, length in self.title_automaton.iter(lowered):
+            start = end - length + 1
+            if is_word_boundary(text, start) and is_word_boundary(text, end + 1):
+                hits.append((start, -length))
+        # like a regex scan: take the leftmost hit (longest first), then carry on after it
+        titles = []
+        position = 0
+        for start, negative_length in sorted(hits):
+            if start >= position:
+                position = start - negative_length
+                titles.append(text[start:position])
+        return titles
+
     def fuzzy_match_titles(self, text):
         # self.logger.info("Fuzzy matching titles.")
-        words = text.split()
+        words = utils.default_process(text).split()
         
-        # Dynamically generate potential titles by combining 3 words at a time
-        potential_titles = []
-        for n in range(2, 5):
-            potential_titles = [' '.join(words[i:i+3]) for i in range(len(words) - n + 1)]
-            
-        matches = process.extract(' '.join(potential_titles), self.title_keywords, limit=5)
+        # every 2, 3 and 4 word window is a potential title; repeated windows are scored once
+        potential_titles = list(dict.fromkeys(
+            ' '.join(words[i:i + n]) for n in (2, 3, 4) for i in range(len(words) - n + 1)
+        ))
+        if not potential_titles:
+            return []
+        
+        # every keyword against every window in one batched C call; pairs under the cutoff score 0
+        scores = process.cdist(self.processed_title_keywords, potential_titles, scorer=fuzz.WRatio,
+                               processor=None, score_cutoff=30, dtype=np.float64)
+        # each keyword's best score; keyed (score, -index) so equal scores go to the earlier keyword
+        best = [(score, -index) for index, score in enumerate(scores.max(axis=1).tolist()) if score > 30]
         # self.logger.info(f"Found {len(matches)} fuzzy matches.")
-        return [(match[0], match[1]) for match in matches if match[1] > 30]
+        return [(self.title_keywords[-negated_index], score) for score, negated_index in heapq.nlargest(5, best)]
 
 
 class ContextualExtractor(BaseExtractor):
@@ -260,67 +350,101 @@ class ContextualExtractor(BaseExtractor):
         context_keywords (dict): A dictionary containing contextual keywords categorized by weight.
     Methods:
         `extract(content)`: Extracts contextual information from the given HTML content.
-        `find_contextual_elements(soup)`: Finds contextual elements in a BeautifulSoup object.
+        `extract_tree(tree)`: Extracts contextual information from an already parsed lxml tree.
+        `find_contextual_elements(tree)`: Finds contextual elements in an lxml tree.
         `extract_from_element(element, context_weight)`: Extracts infor from a given element.
+        `extract_from_text(text, context_weight)`: Extracts infor from an element's text.
         `calculate_confidence(item, context_weight)`: Calculates confidence for extracted items.
-        `extract_structured_data(soup)`: Extracts structured data from the BeautifulSoup object.
+        `extract_structured_data(tree)`: Extracts structured data from the lxml tree.
         """
     def __init__(self, registry):
         super().__init__()
         self.registry = registry
         # self.logger = get_logger(self.__class__.__name__)
-        self.context_keywords = {
-            'high': ['about', 'team', 'contact', 'leadership', 'management', 'staff', 'employees', 'board', 'executives'],
-            'medium': ['directory', 'people', 'department', 'faculty', 'personnel', 'crew', 'members', 'positions', 'roles'],
-            'low': ['company', 'organization', 'group', 'division', 'unit', 'leaders', 'managers']
-        }
+        self.context_keywords = CONTEXT_KEYWORDS
+        self.weight_patterns = CONTEXT_WEIGHT_PATTERNS
+        self.any_keyword_pattern = ANY_CONTEXT_KEYWORD_PATTERN
+        self.html_parser = HTMLParser()
+        self.text_nodes_xpath = etree.XPath('.//text()[not(ancestor::script or ancestor::style)]')
+        self.next_sibling_xpath = etree.XPath('following-sibling::*[1]')
+        self.vcard_xpath = etree.XPath('//div[%s]' % has_class("'vcard'"))
+        self.vcard_field_xpath = etree.XPath('.//*[%s]' % has_class('$name'))
+        self.json_ld_xpath = etree.XPath("//script[@type='application/ld+json']")
 
     def extract(self, content):
-        self.logger.debug(f"Extracting contextual information from content (length: {len(content)})")
+        self.logger.debug("Extracting contextual information from content (length: %d)", len(content))
         
-        # input content should always be a string.
-        if not isinstance(content, str):
-            self.logger.info(f"Content received was not a string (type: {type(content)}). Converting to string.")
-            if isinstance(content, list):
-                content = ' '.join(map(str, content))  # Convert list elements to strings and join
-            else:
-                content = str(content)  # Convert other types to string
-                
-        soup = BeautifulSoup(content, 'html.parser')
-        contextual_elements = self.find_contextual_elements(soup)
+        # input content should always be a string (or raw bytes, which lxml decodes itself).
+        if not isinstance(content, bytes):
+            content = self._ensure_str(content)
+        
+        return self.extract_tree(self.html_parser.document(content))
+
+    def extract_tree(self, tree):
+        """Contextual results for a page that was already parsed with lxml."""
+        contextual_elements = self.find_contextual_elements(tree)
         results = []
         
+        # nested wrappers and headings' siblings often repeat the same text; each distinct text is extracted once
+        seen_texts = set()
         for element, weight in contextual_elements:
-            results.extend(self.extract_from_element(element, weight))
+            text = self.element_text(element)
+            if text in seen_texts:
+                continue
+            seen_texts.add(text)
+            results.extend(self.extract_from_text(text, weight))
         
         # Extract structured data
-        results.extend(self.extract_structured_data(soup))
+        results.extend(self.extract_structured_data(tree))
         
         return results
 
-    def find_contextual_elements(self, soup):
+    def find_contextual_elements(self, tree):
         elements = []
-        for weight, keywords in self.context_keywords.items():
-            for keyword in keywords:
-                found_elements = soup.find_all(['div', 'section', 'article', 'aside', 'header', 'footer'], 
-                                               class_=lambda x: x and keyword in x.lower())
-                found_elements.extend(soup.find_all(['div', 'section', 'article', 'aside', 'header', 'footer'], 
-                                                    id=lambda x: x and keyword in x.lower()))
-                elements.extend([(elem, weight) for elem in found_elements])
+        # walk the containers once, tagging each with the strongest weight whose keywords appear in its class or id
+        for elem in tree.iter(*CONTEXT_CONTAINER_TAGS):
+            attrs = ' '.join(elem.get('class', '').split()) + ' ' + elem.get('id', '')
+            for weight, pattern in self.weight_patterns.items():
+                if pattern.search(attrs):
+                    elements.append((elem, weight))
+                    break
         
         # Consider proximity to h1, h2, h3 tags with relevant keywords
-        headers = soup.find_all(['h1', 'h2', 'h3'])
+        headers = tree.iter('h1', 'h2', 'h3')
         for header in headers:
-            if any(keyword in header.get_text().lower() for keywords in self.context_keywords.values() for keyword in keywords):
-                next_sibling = header.find_next_sibling()
+            # one pass over the heading text instead of a get_text().lower() per keyword
+            if self.any_keyword_pattern.search(self.element_text(header)):
+                next_sibling = self.next_sibling_xpath(header)
                 if next_sibling:
-                    elements.append((next_sibling, 'high'))
+                    elements.append((next_sibling[0], 'high'))
         
         return elements
 
+    def element_text(self, element):
+        """`element`'s text the way BeautifulSoup's get_text() returns it.
+        Script and style content is left out, and whitespace-only strings shrink to one newline or space outside pre/textarea.
+        """
+        parts = []
+        # a script or style element itself still gives its own content
+        texts = element.xpath('text()') if element.tag in ('script', 'style') else self.text_nodes_xpath(element)
+        for text in texts:
+            if not text.isspace():
+                parts.append(text)
+                continue
+            parent = text.getparent()
+            if text.is_tail:
+                parent = parent.getparent()
+            if parent is not None and (parent.tag in WHITESPACE_PRESERVING_TAGS or next(parent.iterancestors(*WHITESPACE_PRESERVING_TAGS), None) is not None):
+                parts.append(text)
+            else:
+                parts.append('\n' if '\n' in text else ' ')
+        return ''.join(parts)
+
     def extract_from_element(self, element, context_weight):
+        return self.extract_from_text(self.element_text(element), context_weight)
+
+    def extract_from_text(self, text, context_weight):
         results = []
-        text = element.get_text()
         
         # Use other extractors
         for extractor_name in ['email', 'name', 'phone', 'title']:
@@ -338,71 +462,95 @@ class ContextualExtractor(BaseExtractor):
         weight_factor = {'high': 1.2, 'medium': 1.1, 'low': 1.0}
         return min(base_confidence * weight_factor[context_weight], 1.0)
 
-    def extract_structured_data(self, soup):
+    def extract_structured_data(self, tree):
         results = []
         
         # Extract vCard data
-        vcard_elements = soup.find_all('div', class_='vcard')
+        vcard_elements = self.vcard_xpath(tree)
         for vcard in vcard_elements:
-            name = vcard.find(class_='fn')
-            org = vcard.find(class_='org')
-            email = vcard.find(class_='email')
-            tel = vcard.find(class_='tel')
-            
-            if name:
-                results.append({'type': 'name', 'value': name.get_text()})
-            if org:
-                results.append({'type': 'organization', 'value': org.get_text()})
-            if email:
-                results.append({'type': 'email', 'value': email.get_text()})
-            if tel:
-                results.append({'type': 'phone', 'value': tel.get_text()})
+            for class_name, result_type in VCARD_FIELDS:
+                field = self.vcard_field_xpath(vcard, name=class_name)
+                if field:
+                    results.append({'type': result_type, 'value': self.element_text(field[0])})
         
         # Extract JSON-LD data
-        json_ld_scripts = soup.find_all('script', type='application/ld+json')
+        json_ld_scripts = self.json_ld_xpath(tree)
         for script in json_ld_scripts:
             try:
-                data = json.loads(script.string)
-                if isinstance(data, list):
-                    data = data[0]
-                if isinstance(data, dict) and '@type' in data:
-                    if data['@type'] in ['Person', 'Organization']:
-                        if 'name' in data:
-                            results.append({'type': 'name', 'value': data['name']})
-                        if 'email' in data:
-                            results.append({'type': 'email', 'value': data['email']})
-                        if 'telephone' in data:
-                            results.append({'type': 'phone', 'value': data['telephone']})
-                        if 'jobTitle' in data:
-                            results.append({'type': 'title', 'value': data['jobTitle']})
-            except (json.JSONDecodeError, KeyError) as e:
-                self.logger.warning(f"Failed to parse JSON-LD data: {e}")
+                data = orjson.loads(script.text or b'')
+            except orjson.JSONDecodeError as e:
+                self.logger.warning("Failed to parse JSON-LD data: %s", e)
+                continue
+            # a script may hold a single object or a list of them
+            for entry in (data if isinstance(data, list) else [data]):
+                if isinstance(entry, dict) and entry.get('@type') in ('Person', 'Organization'):
+                    if 'name' in entry:
+                        results.append({'type': 'name', 'value': entry['name']})
+                    if 'email' in entry:
+                        results.append({'type': 'email', 'value': entry['email']})
+                    if 'telephone' in entry:
+                        results.append({'type': 'phone', 'value': entry['telephone']})
+                    if 'jobTitle' in entry:
+                        results.append({'type': 'title', 'value': entry['jobTitle']})
         
         return results
 
 
 class HTMLParser:
-    def parse(self, html):
+    """Parses a page with lxml and pulls out the content the extractors work on.
+
+    Accepts raw HTML or an lxml tree that was already built for the page (e.g. by `AsyncScraper`),
+    in which case no second parse happens.
+    """
+    def __init__(self):
+        # str input is re-encoded so pages with an XML encoding declaration still parse
+        self.utf8_parser = lxml.html.HTMLParser(encoding='utf-8')
+        lower = "translate(@name, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+        self.meta_xpath = etree.XPath(f"//meta[contains({lower}, 'description') or contains({lower}, 'keywords')]")
+        self.links_xpath = etree.XPath('//a[@href]')
+        self.contact_xpath = etree.XPath(
+            "//*[self::a or self::p or self::div or self::span]"
+            "[contains(concat(' ', normalize-space(@class), ' '), ' contact ') or contains(@id, 'contact')]"
+        )
+
+    def parse(self, html, anchors=None):
         if isinstance(html, list):
             # self.logger.info("HTML content recieved was type: `list` in HTMLParser")
             html = ' '.join(map(str, html)) # Convert all elements to strings and join them
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = html if isinstance(html, etree._Element) else self.document(html)
         parsed_content = {
-            'text': soup.get_text(),
-            'meta': self._extract_meta(soup),
-            'links': self._extract_links(soup),
-            'contact_elements': self._extract_contact_elements(soup)
+            'tree': tree,
+            'text': self._extract_text(tree),
+            'meta': self._extract_meta(tree),
+            'links': self._extract_links(tree, anchors),
+            'contact_elements': self._extract_contact_elements(tree)
         }
         return parsed_content
 
-    def _extract_meta(self, soup):
-        return [tag.get('content', '') for tag in soup.find_all('meta') if 'description' in tag.get('name', '').lower() or 'keywords' in tag.get('name', '').lower()]
+    def document(self, html):
+        """The lxml tree for raw HTML given as str or bytes."""
+        try:
+            if isinstance(html, bytes):
+                return lxml.html.document_fromstring(html)
+            return lxml.html.document_fromstring(html.encode('utf-8'), parser=self.utf8_parser)
+        except etree.ParserError:
+            # blank or comment-only input has no root element; treat it as an empty page
+            return lxml.html.document_fromstring('<html></html>')
+
+    def _extract_text(self, tree):
+        return ''.join(tree.xpath('//text()[not(ancestor::script or ancestor::style)]'))
+
+    def _extract_meta(self, tree):
+        # the filter runs inside libxml2; tags without a content attribute still count, as ''
+        return [tag.get('content', '') for tag in self.meta_xpath(tree)]
 
-    def _extract_links(self, soup):
-        return [{'text': a.get_text(), 'href': a.get('href')} for a in soup.find_all('a', href=True)]
+    def _extract_links(self, tree, anchors=None):
+        if anchors is None:
+            anchors = self.links_xpath(tree)
+        return [{'text': a.text_content(), 'href': a.get('href')} for a in anchors]
 
-    def _extract_contact_elements(self, soup):
-        return [elem.get_text() for elem in soup.find_all(['a', 'p', 'div', 'span']) if 'contact' in elem.get('class', []) or 'contact' in elem.get('id', '')]
+    def _extract_contact_elements(self, tree):
+        return [elem.text_content() for elem in self.contact_xpath(tree)]
 
 
 class ResultAggregator:
@@ -415,44 +563,34 @@ class ResultAggregator:
         self.logger = get_logger(self.__class__.__name__)
              
     def aggregate(self, results):
-        self.logger.info(f"Aggregating {len(results)} results.")
-        
-        # Initialize an empty dictionary `aggregated` to store the final results
-        aggregated = {}
+        """Fold `results` (any iterable, consumed once) into unique type/value pairs in a single pass."""
+        # Use a set per type to avoid duplicate values
+        aggregated = defaultdict(set)
+        count = 0
         
         # Iterate over each result in the given list of results
         for result in results:
-            self.logger.debug(f"Processing Result: {result}")
-            if isinstance(result, str):
-                self.logger.warning(f"String result (skipped): {result}")
-                continue
-            
-            if not isinstance(result, dict) or 'type' not in result or 'value' not in result:
-                self.logger.warning(f"Skipping improperly formatted result: {result}")
+            count += 1
+            try:
+                result_type, value = result['type'], result['value']
+            except (TypeError, KeyError, IndexError):
+                # strings, lists and dicts missing a key
+                self.logger.warning("Skipping improperly formatted result: %s", result)
                 continue
             
-            result_type = result['type']
-            value = result['value']
-            
             # Skip any results where the value is 'not_found'
-            if value == 'not_found':
-                self.logger.debug(f"Skipping result with value 'not_found': {result}")
-                continue
-            
-            # If result_type is not in aggregated, initialize it
-            if result_type not in aggregated:
-                aggregated[result_type] = set()  # Use a set to avoid duplicate values
-            
-            # Add the value to the set for this result_type
-            aggregated[result_type].add(value)
+            if value != 'not_found':
+                aggregated[result_type].add(value)
+        self.logger.info("Aggregated %d results.", count)
     
         # Convert the aggregated dictionary back to a list of dictionaries without confidence
         return [{'type': k, 'value': v} for k, values in aggregated.items() for v in values]
 
 
 class Registry:
-    def __init__(self):
-        self.extractors = {}
+    def __init__(self, extractors=None):
+        # a copy, so registering here never changes the mapping it was built from
+        self.extractors = dict(extractors or {})
         
     def register(self, name, extractor):
         if isinstance(extractor, type) and issubclass(extractor, BaseExtractor):
@@ -469,19 +607,39 @@ class Registry:
         return list(self.extractors.values())
 
 
+@lru_cache(maxsize=None)
+def builtin_extractors():
+    """The process-wide email, name, phone and title extractors by name, built once on first use.
+    They are only read during extraction, so every `ContactInfoExtractor` can share the same instances.
+    """
+    return {
+        'email': EmailExtractor(),
+        'name': FullNameExtractor(),
+        'phone': PhoneExtractor(),
+        'title': TitleExtractor(),
+    }
+
+
 class ContactInfoExtractor:
     def __init__(self):
-        self.registry = Registry()
-        self.registry.register('email', EmailExtractor)
-        self.registry.register('name', FullNameExtractor)
-        self.registry.register('phone', PhoneExtractor)
-        self.registry.register('title', TitleExtractor)
+        # a registry of its own, so register() only affects this instance, over the shared built-in extractors
+        self.registry = Registry(builtin_extractors())
         self.registry.register('contextual', ContextualExtractor(self.registry))
         self.html_parser = HTMLParser()
         self.result_aggregator = ResultAggregator()
         self.logger = get_logger(self.__class__.__name__)
+        # content hash -> (extracted_info, warnings), least recently used first
+        self._cache = OrderedDict()
+
+    def extract_contact_info(self, url, html, tree=None, anchors=None):
+        """Extract contact info from a page.
 
-    def extract_contact_info(self, url, html):
+        Args:
+            url (str): URL of the page.
+            html (str | bytes): Raw HTML of the page.
+            tree (lxml.html.HtmlElement): Optional tree already parsed from `html`; reused instead of parsing again.
+            anchors ([lxml.html.HtmlElement]): Optional `a[@href]` elements of `tree`, if the caller already selected them.
+        """
         status = {
             'url': url,
             'status': 'success',
@@ -491,84 +649,91 @@ class ContactInfoExtractor:
         }
         
         try:
-            if not isinstance(html, str):
+            if not isinstance(html, (str, bytes)):
                 # self.logger.debug(f"HTML content received was not a string (type: {type(html)}). Converting to string.")
                 html = self.convert_to_string(html)
             
             if not html:
-                self.logger.warning(f"No HTML content recieved for URL: {url}")
+                self.logger.warning("No HTML content recieved for URL: %s", url)
                 status['warnings'].append("Empty HTML content")
                 return status
-            parsed_content = self.html_parser.parse(html)
-            results = []
             
-            # Try Contextual Extractor First
-            contextual_extractor = self.registry.get_extractor('contextual')
-            try:
-                contextual_results = contextual_extractor.extract(html)
-                results.extend(contextual_results)
-                
-            except Exception as e:
-                status['warnings'].append(f"Contextual Extraction failed: {str(e)}")
-                self.logger.warning(f"Contextual Extraction failed for {url}: {str(e)}", exc_info=True)
-            
-            # Try other extractors for any remaining content
-            for extractor_name in ['email', 'name', 'title']:
-                
-                extractor = self.registry.get_extractor(extractor_name)
-                self.logger.debug(f"Extracting ``{extractor_name}'s`` from: {url}")
-                
-                try:
-                    results.extend(self.extract_from_parsed_content(extractor, parsed_content))
-                except Exception as e:
-                    status['warnings'].append(f"{extractor_name.capitalize()} extraction failed: {str(e)}")
-                    self.logger.warning(f"{extractor_name.capitalize()} extraction failed for {url}: {str(e)}", exc_info=True)
-            self.logger.info(f"Total results before aggregation: {len(results)}")
-            count = 1
-            for result in results:
-                c = count++1
-                self.logger.debug(f"Result Before Aggregation {c}. {result}")
+            # identical pages (mirrors, repeated templates, the same page under several URLs) are extracted once
+            key = hashlib.blake2b(html if isinstance(html, bytes) else html.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                extracted_info, warnings = cached
+                status['extracted_info'] = [dict(item) for item in extracted_info]
+                status['warnings'].extend(warnings)
+                self.logger.info("Reused %d cached results for URL: %s", len(extracted_info), url)
+                return status
             
-            valid_results = [r for r in results if isinstance(r, dict) and 'type' in r and 'value' in r]
-            self.logger.debug(f"Valid Results before aggregation: {valid_results}")
+            parsed_content = self.html_parser.parse(html if tree is None else tree, anchors=anchors)
             
-            aggregated_results = self.result_aggregator.aggregate(valid_results)
+            # results stream from the extractors straight into the aggregator; no per-page list is built
+            aggregated_results = self.result_aggregator.aggregate(self.collect_results(url, parsed_content, status))
             status['extracted_info'] = aggregated_results
-            self.logger.info(f"Successfully extracted and aggregated {len(aggregated_results)} results from URL: {url}")
+            self.logger.info("Successfully extracted and aggregated %d results from URL: %s", len(aggregated_results), url)
+            
+            self._cache[key] = ([dict(item) for item in aggregated_results], list(status['warnings']))
+            if len(self._cache) > RESULT_CACHE_SIZE:
+                self._cache.popitem(last=False)
             
             return status
 
         except Exception as e:
             status['status'] = 'failure'
             status['errors'].append(str(e))
-            self.logger.error(f"Error extracting contact info from {url}: {str(e)}", exc_info=True)
+            self.logger.error("Error extracting contact info from %s: %s", url, e, exc_info=True)
             return status
     
+    def collect_results(self, url, parsed_content, status):
+        """Yield every extractor's results for the page, recording failed extractors in `status`."""
+        # Try Contextual Extractor First
+        contextual_extractor = self.registry.get_extractor('contextual')
+        try:
+            # the tree HTMLParser built is reused, so the page is parsed once
+            yield from contextual_extractor.extract_tree(parsed_content['tree'])
+            
+        except Exception as e:
+            status['warnings'].append(f"Contextual Extraction failed: {str(e)}")
+            self.logger.warning("Contextual Extraction failed for %s: %s", url, e, exc_info=True)
+        
+        # Try other extractors for any remaining content
+        for extractor_name in ['email', 'name', 'title']:
+            
+            extractor = self.registry.get_extractor(extractor_name)
+            self.logger.debug("Extracting ``%s's`` from: %s", extractor_name, url)
+            
+            try:
+                yield from self.extract_from_parsed_content(extractor, parsed_content)
+            except Exception as e:
+                status['warnings'].append(f"{extractor_name.capitalize()} extraction failed: {str(e)}")
+                self.logger.warning("%s extraction failed for %s: %s", extractor_name.capitalize(), url, e, exc_info=True)
+
     def convert_to_string(self, content):
         if isinstance(content, list):
             return ' '.join(map(str, content))
         return str(content)
 
     def extract_from_parsed_content(self, extractor, parsed_content):
-        results = []
-        
+        """Yield results for each part of the parsed page; the caller consumes them straight into its own list."""
         # Handle text content
         text_content = self.convert_to_string(parsed_content['text'])
-        results.extend(extractor.safe_extract(text_content))
+        yield from extractor.safe_extract(text_content)
         
         # Handle meta content
         meta_content = self.convert_to_string(parsed_content['meta'])
-        results.extend(extractor.safe_extract(meta_content))
+        yield from extractor.safe_extract(meta_content)
         
         # Handle links content
         for link in parsed_content['links']:
             link_text = self.convert_to_string(link['text'])
-            results.extend(extractor.safe_extract(link_text))
+            yield from extractor.safe_extract(link_text)
             
             if isinstance(extractor, EmailExtractor) and link['href'].startswith('mailto:'):
-                results.append({'type': 'email', 'value': link['href'][7:], 'confidence': 1.0})
-        
-        return results
+                yield {'type': 'email', 'value': link['href'][7:], 'confidence': 1.0}
 
 
 
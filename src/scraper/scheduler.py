@@ -30,11 +30,20 @@ from src.utils.logging_utils import get_logger
 logger = get_logger(__name__)
 
 
+def rate_limiter(max_rate, time_period):
+    """ An `AsyncLimiter` for `max_rate` requests per `time_period` seconds
+    A limiter can't admit a request while its capacity is below 1, so fractional rates (e.g. 0.5 per second)
+    become one request per proportionally longer period.
+    """
+    if max_rate < 1:
+        return AsyncLimiter(1, time_period / max_rate)
+    return AsyncLimiter(max_rate, time_period)
+
 class RateLimitedScheduler:
     def __init__(self):
-        self.global_limiter = AsyncLimiter(config.GLOBAL_RATE_LIMIT, config.GLOBAL_TIME_PERIOD)
+        self.global_limiter = rate_limiter(config.GLOBAL_RATE_LIMIT, config.GLOBAL_TIME_PERIOD)
         self.domain_limiters = defaultdict(
-            lambda: AsyncLimiter(config.DOMAIN_RATE_LIMIT, config.DOMAIN_TIME_PERIOD)
+            lambda: rate_limiter(config.DOMAIN_RATE_LIMIT, config.DOMAIN_TIME_PERIOD)
         )
         self.queue = asyncio.Queue()
 
@@ -107,7 +116,7 @@ class DownloadScheduler:
         await self.rate_limiter.add_url(url)
         rate_limited_url = await self.rate_limiter.get_url()
         if rate_limited_url:
-            return await download_with_rate_limit(rate_limited_url, self.rate_limiter)
+            return await download_with_rate_limit(rate_limited_url, self.rate_limiter.global_limiter)
         return None
 
 
@@ -1,5 +1,12 @@
+import asyncio
+
+import aiohttp
+
+from src.config import config
+from src.scraper.async_engine import AsyncScraper
+from src.scraper.downloader import BatchRenderer, needs_render, run_with_qt
 from src.scraper.extractors import ContactInfoExtractor
-from src.scraper.scheduler import DownloadScheduler
+from src.scraper.scheduler import RateLimitedScheduler
 from src.scraper.urls import Url
 from src.scraper.wrapper import Wrapper
 from src.utils.logging_utils import get_logger
@@ -17,13 +24,13 @@ class ScraperEngine:
         results = []
         self.logger.info(f"Starting to scrape {len(urls)} URLs")
 
-        def callback(url, html):
+        def callback(url, html, tree=None):
             try:
                 self.logger.debug(f"Scraping URL: {url}")
                 if self.use_auto_scraper:
                     contact_info = self.auto_scraper.get_result(url)
                 else:
-                    contact_info = self.extractor.extract_contact_info(url, html)
+                    contact_info = self.extractor.extract_contact_info(url, html, tree=tree)
                 if contact_info:
                     results.extend(contact_info)
                     self.logger.info(f"Found {len(contact_info)} contacts at {url}")
@@ -36,16 +43,75 @@ class ScraperEngine:
         self.logger.debug(f"Initial URLs prepared: {initial_urls}")
 
         try:
-            scheduler = DownloadScheduler(callback, initial=initial_urls, processes=4)
-            self.logger.debug("DownloadScheduler initialized")
-            scheduler.schedule()
-            self.logger.info("Scheduler finished")
+            pages = asyncio.run(self.download_all([url.url for url in initial_urls]))
+            self.logger.info("Downloads finished")
         except Exception as e:
-            self.logger.error("Error during scheduling: ", exc_info=True)
+            self.logger.error("Error during downloading: ", exc_info=True)
+            pages = []
+
+        # pages the plain fetch couldn't get, or whose content is built with JavaScript, are rendered as before
+        to_render = [url for url, html, tree, content_type in pages if html is None or needs_render(url, html, content_type)]
+        if to_render:
+            pages = self.render_pages(pages, to_render)
+
+        for url, html, tree, _ in pages:
+            if html:
+                callback(url, html, tree)
 
         self.logger.info(f"Total results found: {len(results)}")
         return results
 
+    async def download_all(self, urls):
+        """ Download every URL concurrently over one session
+        Args:
+            urls ([str]): URLs to download
+        Returns:
+            ([(str, bytes, HtmlElement, str)]): (url, html, tree, content_type) per URL; all but the url are None
+            if the download failed
+        """
+        # reuse AsyncScraper's fetch (retries, per-host semaphores, streamed parse)
+        max_per_host = max(1, config.SCRAPE_CONCURRENCY_PER_HOST)
+        fetcher = AsyncScraper(concurrency=max(1, config.SCRAPE_CONCURRENCY), max_per_host=max_per_host, extractor=self.extractor)
+        # the configured requests-per-second rates, metered the same way DownloadScheduler meters them
+        limits = RateLimitedScheduler()
+        connector = aiohttp.TCPConnector(
+            limit=1000, limit_per_host=max_per_host, resolver=aiohttp.AsyncResolver(), ttl_dns_cache=300, enable_cleanup_closed=True
+        )
+        async with aiohttp.ClientSession(headers=AsyncScraper.headers, connector=connector) as session:
+            async def download(url):
+                limiters = (limits.global_limiter, limits.domain_limiters[limits.extract_domain(url)])
+                return (url, *await fetcher.fetch_page(session, url, limiters))
+
+            return await asyncio.gather(*(download(url) for url in urls))
+
+    def render_pages(self, pages, urls):
+        """ Render `urls` with QtWebEngine and put the rendered HTML in place of their plain downloads
+        Args:
+            pages ([(str, bytes, HtmlElement, str)]): (url, html, tree, content_type) per URL, as returned by `download_all`
+            urls ([str]): The URLs among `pages` to render
+        Returns:
+            ([(str, bytes | str, HtmlElement, str)]): `pages`, with rendered pages as (url, html, None, 'text/html');
+            a page that fails to render keeps its plain download
+        """
+        async def render_all():
+            # a fresh pool per run, since each run_with_qt call starts a new event loop
+            return await BatchRenderer(concurrency=config.RENDER_CONCURRENCY).render_many(urls)
+
+        self.logger.info(f"Rendering {len(urls)} pages")
+        coro = render_all()
+        try:
+            rendered = run_with_qt(coro)
+        except ImportError as e:
+            coro.close()
+            self.logger.warning(f"Can't render pages without PyQt5/qasync ({e}); using the plain downloads")
+            return pages
+        except Exception:
+            coro.close()
+            self.logger.error("Error during rendering: ", exc_info=True)
+            return pages
+        return [(url, rendered[url], None, 'text/html') if rendered.get(url) else (url, html, tree, content_type)
+                for url, html, tree, content_type in pages]
+
 # import os
 # import logging
 # from contact_info import ContactInfoExtractor
@@ -1,101 +1,133 @@
 import re
+from bisect import bisect_right
 from collections import defaultdict
-
-from bs4 import BeautifulSoup
+from itertools import accumulate
+
+import ahocorasick
+import lxml.html
+from lxml import etree
+
+# compiled once at import and shared by every Wrapper
+EMAIL_PATTERN = re.compile(r'(?<![A-Za-z0-9._%+-])[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,255}\.[A-Za-z]{2,24}(?![A-Za-z0-9-])')
+NAME_PATTERN = re.compile(r'\b[A-Z][a-z]+(?: [A-Z][a-z]+)+\b')
+PHONE_PATTERN = re.compile(r'\b(?:\+\d{1,2}\s?)?(?:\(\d{3}\)|\d{3})[-.\s]?\d{3}[-.\s]?\d{4}\b')
+
+TITLE_KEYWORDS = [
+    'CEO', 'CTO', 'CFO', 'COO', 'President', 'Vice President', 'Director',
+    'Manager', 'Engineer', 'Developer', 'Designer', 'Analyst', 'Specialist',
+    'Coordinator', 'Administrator', 'Supervisor', 'Lead', 'Head', 'Chief',
+    'Technician', 'Scientist', 'Pilot', 'Inspector', 'Consultant', 'Architect',
+    'Operator', 'Instructor', 'Planner', 'Strategist', 'Estimator', 'Fabricator',
+    'Assembler', 'Machinist', 'Welder', 'Mechanic', 'Tester', 'Trainer',
+    'Project Manager', 'Program Manager', 'Systems Engineer', 'Avionics Engineer',
+    'Test Engineer', 'Flight Engineer', 'Manufacturing Engineer', 'Quality Engineer',
+    'Structural Engineer', 'Aerospace Engineer', 'Electrical Engineer', 'Software Engineer',
+    'Mechanical Engineer', 'Materials Engineer', 'Safety Engineer', 'Reliability Engineer',
+    'Design Engineer', 'Research Scientist', 'Principal Investigator', 'Field Service Engineer',
+    'Compliance Manager', 'Logistics Manager', 'Supply Chain Manager', 'Production Manager',
+    'Operations Manager', 'Business Development Manager', 'Customer Service Manager',
+    'Integration Engineer', 'Mission Manager', 'Payload Specialist', 'Propulsion Engineer',
+    'Satellite Engineer', 'Thermal Engineer', 'Dynamics Engineer', 'RF Engineer',
+    'Guidance, Navigation, and Control (GNC) Engineer', 'Ordnance Engineer', 'Launch Director',
+    'Ground Systems Engineer', 'Mission Operations Engineer', 'Systems Architect',
+    'Configuration Manager', 'Risk Manager', 'Test Technician', 'Calibration Technician',
+    'Electronics Technician', 'Maintenance Technician', 'Program Analyst', 'Budget Analyst',
+    'Contract Administrator', 'Procurement Specialist', 'Inventory Manager', 'Supply Chain Analyst',
+    'IT Manager', 'Cybersecurity Specialist', 'Data Scientist', 'AI Specialist', 'Robotics Engineer',
+    'Control Systems Engineer', 'Optical Engineer', 'Spacecraft Operations Specialist',
+    'Business Analyst', 'Marketing Manager', 'Sales Manager', 'Communications Manager',
+    'Human Resources Manager', 'Talent Acquisition Specialist', 'Training Coordinator',
+    'Safety Manager', 'Environmental Engineer', 'Sustainability Manager', 'Innovation Manager',
+    'Customer Support Engineer', 'Technical Support Specialist', 'Field Operations Manager',
+    'Quality Assurance Manager', 'Regulatory Affairs Manager', 'Patent Agent', 'Legal Counsel'
+]
+
+# one automaton over every keyword, so each text is scanned once instead of once per keyword
+TITLE_AUTOMATON = ahocorasick.Automaton()
+for keyword in TITLE_KEYWORDS:
+    TITLE_AUTOMATON.add_word(keyword.lower(), keyword)
+TITLE_AUTOMATON.make_automaton()
 
 class Wrapper:
     def __init__(self):
-        self.email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-        self.name_pattern = re.compile(r'\b[A-Z][a-z]+(?: [A-Z][a-z]+)+\b')
-        self.phone_pattern = re.compile(r'\b(?:\+\d{1,2}\s?)?(?:\(\d{3}\)|\d{3})[-.\s]?\d{3}[-.\s]?\d{4}\b')
-        self.title_keywords = [
-            'CEO', 'CTO', 'CFO', 'COO', 'President', 'Vice President', 'Director',
-            'Manager', 'Engineer', 'Developer', 'Designer', 'Analyst', 'Specialist',
-            'Coordinator', 'Administrator', 'Supervisor', 'Lead', 'Head', 'Chief',
-            'Technician', 'Scientist', 'Pilot', 'Inspector', 'Consultant', 'Architect',
-            'Operator', 'Instructor', 'Planner', 'Strategist', 'Estimator', 'Fabricator',
-            'Assembler', 'Machinist', 'Welder', 'Mechanic', 'Tester', 'Trainer',
-            'Project Manager', 'Program Manager', 'Systems Engineer', 'Avionics Engineer',
-            'Test Engineer', 'Flight Engineer', 'Manufacturing Engineer', 'Quality Engineer',
-            'Structural Engineer', 'Aerospace Engineer', 'Electrical Engineer', 'Software Engineer',
-            'Mechanical Engineer', 'Materials Engineer', 'Safety Engineer', 'Reliability Engineer',
-            'Design Engineer', 'Research Scientist', 'Principal Investigator', 'Field Service Engineer',
-            'Compliance Manager', 'Logistics Manager', 'Supply Chain Manager', 'Production Manager',
-            'Operations Manager', 'Business Development Manager', 'Customer Service Manager',
-            'Integration Engineer', 'Mission Manager', 'Payload Specialist', 'Propulsion Engineer',
-            'Satellite Engineer', 'Thermal Engineer', 'Dynamics Engineer', 'RF Engineer',
-            'Guidance, Navigation, and Control (GNC) Engineer', 'Ordnance Engineer', 'Launch Director',
-            'Ground Systems Engineer', 'Mission Operations Engineer', 'Systems Architect',
-            'Configuration Manager', 'Risk Manager', 'Test Technician', 'Calibration Technician',
-            'Electronics Technician', 'Maintenance Technician', 'Program Analyst', 'Budget Analyst',
-            'Contract Administrator', 'Procurement Specialist', 'Inventory Manager', 'Supply Chain Analyst',
-            'IT Manager', 'Cybersecurity Specialist', 'Data Scientist', 'AI Specialist', 'Robotics Engineer',
-            'Control Systems Engineer', 'Optical Engineer', 'Spacecraft Operations Specialist',
-            'Business Analyst', 'Marketing Manager', 'Sales Manager', 'Communications Manager',
-            'Human Resources Manager', 'Talent Acquisition Specialist', 'Training Coordinator',
-            'Safety Manager', 'Environmental Engineer', 'Sustainability Manager', 'Innovation Manager',
-            'Customer Support Engineer', 'Technical Support Specialist', 'Field Operations Manager',
-            'Quality Assurance Manager', 'Regulatory Affairs Manager', 'Patent Agent', 'Legal Counsel'
-        ]
-
+        self.utf8_parser = lxml.html.HTMLParser(encoding='utf-8')
 
     def extract_info(self, html):
-        soup = BeautifulSoup(html, 'html.parser')
-        results = defaultdict(list)
+        try:
+            if isinstance(html, str):
+                # re-encoded so pages with an XML encoding declaration still parse
+                tree = lxml.html.document_fromstring(html.encode('utf-8'), parser=self.utf8_parser)
+            else:
+                tree = lxml.html.document_fromstring(html)
+        except etree.ParserError:
+            # blank or comment-only input has no root element; treat it as an empty page
+            tree = lxml.html.document_fromstring('<html></html>')
+        # sets drop repeated values as they are found instead of after the whole page is collected
+        results = defaultdict(set)
 
         # Extract information from text content
-        for text in soup.stripped_strings:
-            self._extract_from_text(text, results)
+        texts = [text.strip() for text in tree.xpath('//text()[not(ancestor::script or ancestor::style)]')]
+        self._extract_from_strings([text for text in texts if text], results)
 
         # Extract information from specific HTML elements
-        self._extract_from_elements(soup, results)
+        self._extract_from_elements(tree, results)
 
         # Process and format results
         return self._process_results(results)
 
+    def _extract_from_strings(self, texts, results):
+        """ Same results as `_extract_from_text` on each string, but every pattern scans one joined buffer """
+        # NUL can't be part of an email, name or phone match, so nothing matches across two strings
+        buffer = '\0'.join(texts)
+        results['email'].update(EMAIL_PATTERN.findall(buffer))
+        results['name'].update(NAME_PATTERN.findall(buffer))
+        results['phone'].update(PHONE_PATTERN.findall(buffer))
+
+        # a title is the whole string containing a keyword, so map each hit back to its string
+        lowered = [text.lower() for text in texts]
+        ends = list(accumulate(len(text) + 1 for text in lowered))
+        for end, _ in TITLE_AUTOMATON.iter('\0'.join(lowered)):
+            results['title'].add(texts[bisect_right(ends, end)])
+
     def _extract_from_text(self, text, results):
         # Extract email
-        emails = self.email_pattern.findall(text)
-        results['email'].extend(emails)
+        emails = EMAIL_PATTERN.findall(text)
+        results['email'].update(emails)
 
         # Extract names
-        names = self.name_pattern.findall(text)
-        results['name'].extend(names)
+        names = NAME_PATTERN.findall(text)
+        results['name'].update(names)
 
         # Extract phone numbers
-        phones = self.phone_pattern.findall(text)
-        results['phone'].extend(phones)
+        phones = PHONE_PATTERN.findall(text)
+        results['phone'].update(phones)
 
         # Extract titles
-        for keyword in self.title_keywords:
-            if keyword.lower() in text.lower():
-                results['title'].append(text)
-                break
+        if next(TITLE_AUTOMATON.iter(text.lower()), None) is not None:
+            results['title'].add(text)
 
-    def _extract_from_elements(self, soup, results):
+    def _extract_from_elements(self, tree, results):
         # Extract from meta tags
-        meta_tags = soup.find_all('meta')
-        for tag in meta_tags:
+        for tag in tree.iter('meta'):
             name = tag.get('name', '').lower()
             content = tag.get('content', '')
             if 'description' in name or 'keywords' in name:
                 self._extract_from_text(content, results)
 
         # Extract from specific elements often used for contact info
-        for elem in soup.find_all(['a', 'p', 'div', 'span']):
-            if 'contact' in elem.get('class', []) or 'contact' in elem.get('id', ''):
-                self._extract_from_text(elem.get_text(), results)
+        for elem in tree.iter('a', 'p', 'div', 'span'):
+            if 'contact' in elem.get('class', '').split() or 'contact' in elem.get('id', ''):
+                self._extract_from_text(elem.text_content(), results)
 
             # Extract emails from href attributes
             href = elem.get('href', '')
             if href.startswith('mailto:'):
-                results['email'].append(href[7:])
+                results['email'].add(href[7:])
 
     def _process_results(self, results):
         processed = []
         for category, items in results.items():
-            unique_items = list(set(items))  # Remove duplicates
-            for item in unique_items:
+            for item in items:
                 processed.append({"type": category, "value": item})
         
         return sorted(processed, key=lambda x: self._relevance_score(x), reverse=True)
@@ -3,18 +3,28 @@ import csv
 class CSVUtils:
     @staticmethod
     def write_to_csv(data, filename):
-        if not data:
-            return
+        """Write rows to `filename` as they arrive.
 
+        `data` may be any iterable, including a generator; the file is only created once the first row
+        arrives. Returns the number of rows written.
+        """
         fieldnames = ["name", "title", "email", "linkedin", "src_url"]
         
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
+        count = 0
+        csvfile = None
+        try:
             for row in data:
-                # Ensure all fields are present, even if empty
-                row_dict = {field: row.get(field, '') for field in fieldnames}
-                writer.writerow(row_dict)
+                if csvfile is None:
+                    csvfile = open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+                    # missing fields are written empty and extra keys ignored, so rows need no copying
+                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames, restval='', extrasaction='ignore')
+                    writer.writeheader()
+                writer.writerow(row)
+                count += 1
+        finally:
+            if csvfile is not None:
+                csvfile.close()
+        return count
 
     @staticmethod
     def read_from_csv(filename):